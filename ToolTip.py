@@ -1,9 +1,21 @@
 # -*- coding: utf-8 -*-
 
 import tkinter as tk
-import traceback
-import sys
+import tkinter.font as tkfont
+import functools
+import logging
 import math
+import time
+import collections
+import concurrent.futures
+import weakref
+import mmap
+import struct
+import threading
+try:
+    import numpy                                                                #   Optional, vectorised label placement
+except ImportError:
+    numpy = None
 
 
 
@@ -28,13 +40,1283 @@ import math
 ###    V 2.0.2     Feb 8, 2021  Multiple Event handlers tied to one widget will cause one to replace another
 ###                             Resolved by using "add = '+'" option to ensure event handler is added to a list of
 ###                             operations to preform upon event.
+###    V 2.1.0     Oct 18, 2026 ToolTip windows are taken from a per-root pool of withdrawn Toplevels and
+###                             shown / hidden with deiconify / withdraw instead of created and destroyed
+###    V 2.2.0     Oct 18, 2026 ToolTip.register(...) creates many ToolTips in one pass, optionally bound lazily
+###                             on the first <Enter> of their container. No more update() per ToolTip
+###    V 2.3.0     Oct 18, 2026 CanvasToolTip, one <Motion> handler per canvas resolving the item under the cursor
+###                             through a uniform grid over the item bboxes
+###    V 2.4.0     Oct 18, 2026 ToolTip size is computed from cached font metrics, the window is placed before it
+###                             is mapped and no update() is made while hovering
+###    V 2.5.0     Oct 18, 2026 GeometryCache, screen and widget geometry read once and dropped on <Configure>,
+###                             <Map> or scrolling, the canvas ToolTip takes the pointer position from the event
+###    V 2.6.0     Oct 18, 2026 HoverScheduler, one timer per root for show delay, warm hand over between ToolTips
+###                             and auto-hide
+###    V 2.7.0     Oct 18, 2026 <text> may be a callable, optionally computed by a concurrent.futures executor
+###                             while a placeholder is shown, computed texts are kept in a TextCache
+###    V 2.8.0     Oct 18, 2026 ToolTip uses __slots__ and weak references to its widgets, ToolTips are removed
+###                             and unbound when their widget is destroyed, unbind() and remove() added
+###    V 2.9.0     Oct 18, 2026 enable_stats() / ToolTip.stats() counters and timers with hooks and logging replace
+###                             the debugging prints, swallowed errors are counted and logged
+###    V 2.10.0    Oct 18, 2026 ToolTipStyle, named styles shared by ToolTips with one named font per root,
+###                             configure() restyles every ToolTip using the style at once
+###    V 2.11.0    Oct 18, 2026 <maxwidth> / <maxlines>, large texts are wrapped and truncated, only the visible
+###                             part is measured and the layout is cached
+###    V 2.12.0    Oct 18, 2026 <follow> mode, the shown ToolTip moves with the cursor at most <followrate> times
+###                             per second, <followtext> changes its text per position
+###    V 2.13.0    Oct 18, 2026 ItemToolTip, row and cell ToolTips for ttk.Treeview and tk.Listbox through one
+###                             delegated <Motion> binding
+###    V 2.14.0    Oct 18, 2026 ToolTipCatalog, memory-mapped catalog of texts looked up lazily through CatalogKey,
+###                             switching language is a single ToolTipCatalog.activate(...)
+###    V 2.15.0    Oct 18, 2026 UpdateQueue, ToolTip.post(...) changes ToolTips from any thread, changes are
+###                             coalesced per ToolTip and applied by one periodic after(...) on the Tk thread
+###    V 2.16.0    Oct 18, 2026 AnnotationOverlay, labels of all visible CanvasToolTip items at once placed
+###                             without overlap by place_labels(), vectorised with numpy when installed
+###    V 2.17.0    Oct 18, 2026 <incanvas>, canvas ToolTips drawn by a reusable rectangle and text item pair on
+###                             the canvas (CanvasTipItems) instead of a Toplevel, placed in canvas coordinates
+###    V 2.18.0    Oct 18, 2026 ::tkinter_tooltip::show / draw / leave / hide Tcl procs installed once per interpreter,
+###                             showing a ToolTip with its auto-hide timer is a single call into Tcl once layout and
+###                             geometry are cached, <Leave> another one, the hide timers run in Tcl
 ###
 ###
 
-debugging = False
-VERSION     = (2,0,2)
+log = logging.getLogger("ToolTip")
+VERSION     = (2,18,0)
 VERSION_s   = "%s.%s.%s" %VERSION
 
+LABEL_BORDER  = 1                                                               #   ToolTip label border, pixels
+LABEL_IPADX   = 5                                                               #   ToolTip label internal padding, pixels
+LABEL_PADDING = (LABEL_BORDER + 1 + LABEL_IPADX, LABEL_BORDER + 1)              #   Border + label padx/pady + ipadx per side
+
+LARGE_TEXT    = 4096                                                            #   Longer texts are always laid out with limits
+LARGE_WIDTH   = 600                                                             #   Default maximum width in pixels for large texts
+LARGE_LINES   = 40                                                              #   Default maximum number of lines for large texts
+TRUNCATED     = "\u2026"                                                        #   Marks the end of a truncated text
+TEXT_POLL     = 50                                                              #   ms between checks for text computed off the Tk thread
+TEXT_FAILED   = "(no text)"                                                     #   Shown when a callable text raises
+
+_fonts = {}                                                                     #   font tuple -> (root, tkinter.font.Font)
+_executor = None                                                                #   Executor returned by shared_executor()
+
+
+def _font(widget, font):
+    """ return the tkinter.font.Font used to measure <font>, created once """
+    root = widget._root()
+    entry = _fonts.get(font)
+    if entry == None or entry[0] is not root:
+        entry = _fonts[font] = (root, tkfont.Font(root = root, font = font))
+        _measure.cache_clear()                                                  #   Metrics may differ on another root
+        _wrap.cache_clear()
+    return entry[1]
+
+
+def _counted(measure):
+    """ return <measure> counting every call in the font_measures stats counter """
+    def counted(text):
+        _stats.count("font_measures")
+        return measure(text)
+    return counted
+
+
+@functools.lru_cache(maxsize = 4096)
+def _measure(text, font, padding):
+    """ return (width, height) of a ToolTip window showing <text> in <font>, _font() must be called first """
+    metrics = _fonts[font][1]
+    lines = text.split("\n")
+    measure = _counted(metrics.measure) if _stats else metrics.measure
+    width = max(measure(line) for line in lines)
+    height = metrics.metrics("linespace") * len(lines)
+    return width + 2 * padding[0], height + 2 * padding[1]
+
+
+def _layout(text, font, maxwidth, maxlines, padding):
+    """ wrap <text> to <maxwidth> pixels and keep at most <maxlines> lines, _font() must be called first.
+        Only the visible part of <text> is measured, hashed and cached. Return (wrapped text, width, height) """
+    measure = _counted(_fonts[font][1].measure) if _stats else _fonts[font][1].measure
+    limit = max(16, maxwidth * 4 // max(1, measure("0")))                       #   More characters never fit on one line
+    visible = maxlines * (limit + 1) + 1                                        #   Characters the layout can depend on
+    return _wrap(text[:visible], font, maxwidth, maxlines, padding, limit)
+
+
+@functools.lru_cache(maxsize = 256)
+def _wrap(text, font, maxwidth, maxlines, padding, limit):
+    """ _layout() of the visible part <text>, at most <limit> characters per line """
+    measure = _counted(_fonts[font][1].measure) if _stats else _fonts[font][1].measure
+    lines = []
+    start = 0
+    while len(lines) < maxlines:
+        stop = text.find("\n", start)
+        if stop < 0:
+            stop = len(text)
+        while len(lines) < maxlines:                                            #   Wrap one line of <text>
+            chunk = text[start:min(stop, start + limit)]
+            if measure(chunk) <= maxwidth:
+                cut = start + len(chunk)
+            else:
+                low, high = 1, len(chunk)                                       #   Longest prefix fitting <maxwidth>
+                while low < high:
+                    middle = (low + high + 1) // 2
+                    if measure(chunk[:middle]) <= maxwidth:
+                        low = middle
+                    else:
+                        high = middle - 1
+                cut = start + low
+                space = text.rfind(" ", start, cut)
+                if space > start:                                               #   Break after a word if possible
+                    cut = space + 1
+            lines.append(text[start:cut] if cut >= stop else text[start:cut].rstrip(" "))
+            start = cut
+            if start >= stop:
+                break
+        if stop >= len(text):
+            break
+        start = stop + 1
+    if start < len(text) and len(lines) == maxlines:                            #   Text has been truncated
+        last = lines[-1].rstrip()
+        while len(last) > 0 and measure(last + " " + TRUNCATED) > maxwidth:
+            last = last[:-max(1, len(last) // 8)]
+        lines[-1] = last + " " + TRUNCATED
+    width = max(measure(line) for line in lines)
+    height = _fonts[font][1].metrics("linespace") * len(lines)
+    return "\n".join(lines), width + 2 * padding[0], height + 2 * padding[1]
+
+
+def shared_executor(max_workers = 2):
+    """ return a thread pool shared by all ToolTips computing their text off the Tk thread """
+    global _executor
+    if _executor == None:
+        _executor = concurrent.futures.ThreadPoolExecutor(max_workers = max_workers,
+                                                          thread_name_prefix = "ToolTip")
+    return _executor
+
+
+def _computed(call):
+    """ return str(<call>()), TEXT_FAILED if it raises, for callable texts and their futures' result """
+    try:
+        return str(call())
+    except Exception:
+        log.warning("ToolTip text could not be computed", exc_info = True)
+        return TEXT_FAILED
+
+
+
+def _ref(value):
+    """ return a weak reference to a Tkinter widget, any other value is kept as it is """
+    if isinstance(value, tk.Misc):
+        return weakref.ref(value)
+    return value
+
+
+def _deref(value):
+    """ return the Tkinter widget behind a weak reference made by _ref(), None once it is gone """
+    if type(value) == weakref.ref:
+        return value()
+    return value
+
+
+def _unbind(widget, sequence, funcid, item = None):
+    """ remove only the handler <funcid> bound to <sequence>, other handlers bound with add = '+' stay.
+        <item> is the canvas item or tag for canvas bindings """
+    if item == None:
+        script = widget.tk.call("bind", widget._w, sequence)
+    else:
+        script = widget.tk.call(widget._w, "bind", item, sequence)
+    lines = [line for line in str(script).split("\n") if funcid not in line]
+    if item == None:
+        widget.tk.call("bind", widget._w, sequence, "\n".join(lines))
+    else:
+        widget.tk.call(widget._w, "bind", item, sequence, "\n".join(lines))
+    widget.deletecommand(funcid)
+
+
+_TCL_PROCS = r"""
+namespace eval ::tkinter_tooltip {                                             ;#   Not ::tooltip, used by the tklib package
+    variable timer ""                                                          ;#   Auto-hide or idle hide of the visible ToolTip
+}
+proc ::tkinter_tooltip::schedule {w tag ms command} {
+    variable timer
+    if {$ms >= 0} {                                                            ;#   -1 keeps the running timer
+        after cancel $timer
+        set timer ""
+        if {$ms > 0} {
+            set timer [after $ms [list ::tkinter_tooltip::hide $w $tag $command]]
+        }
+    }
+    return $timer
+}
+proc ::tkinter_tooltip::show {w text fg bg font x y ms command} {
+    $w.tooltiplabel configure -text $text -foreground $fg -background $bg -font $font
+    wm geometry $w +$x+$y
+    wm deiconify $w
+    raise $w
+    return [schedule $w "" $ms $command]
+}
+proc ::tkinter_tooltip::leave {w tag command} {
+    variable timer
+    after cancel $timer
+    set timer [after idle [list ::tkinter_tooltip::hide $w $tag $command]]
+    return $timer
+}
+proc ::tkinter_tooltip::hide {w tag command} {
+    variable timer
+    after cancel $timer
+    set timer ""
+    if {[winfo exists $w]} {
+        if {$tag eq ""} {
+            wm withdraw $w
+        } else {
+            $w itemconfigure $tag -state hidden
+        }
+    }
+    uplevel #0 $command
+}
+proc ::tkinter_tooltip::draw {c tag rectangle label text fg bg font x y width height padx pady border ms command} {
+    if {[$c type $rectangle] ne "rectangle" || [$c type $label] ne "text"} {
+        $c delete $tag
+        set rectangle [$c create rectangle 0 0 0 0 -tags $tag -width $border]
+        set label [$c create text 0 0 -tags $tag -anchor nw -justify left]
+    }
+    $c itemconfigure $rectangle -outline $fg -fill $bg
+    $c itemconfigure $label -text $text -fill $fg -font $font
+    $c coords $rectangle $x $y [expr {$x + $width - 1}] [expr {$y + $height - 1}]
+    $c coords $label [expr {$x + $padx}] [expr {$y + $pady}]
+    $c raise $tag
+    $c itemconfigure $tag -state disabled
+    return [list $rectangle $label [schedule $c $tag $ms $command]]
+}
+"""                                                                             #   Whole show / draw / hide of a ToolTip, one call each
+_procs = weakref.WeakSet()                                                      #   Tk roots _TCL_PROCS is installed in
+
+
+def _tcl(widget):
+    """ return the Tcl interpreter of <widget>, the ::tkinter_tooltip procs are installed on first use """
+    root = widget._root()
+    if root not in _procs:
+        root.tk.eval(_TCL_PROCS)
+        _procs.add(root)
+    return root.tk
+
+
+def _candidates(bbox, size, gap):
+    """ return the positions tried, in order, for a label of <size> next to <bbox>: below, above, right, left """
+    x1, y1, x2, y2 = bbox
+    w, h = size
+    return ((x1, y2 + gap), (x1, y1 - gap - h), (x2 + gap, y1), (x1 - gap - w, y1),
+            (x2 - w, y2 + gap), (x2 - w, y1 - gap - h), (x2 + gap, y2 - h), (x1 - gap - w, y2 - h))
+
+
+def _place_numpy(anchors, sizes, placed, region, gap, cellsize = 64):
+    """ place_labels() with the candidates of all labels and the overlap tests computed by numpy,
+        each label is only tested against the placed labels found through a uniform grid """
+    count = len(anchors)
+    anchors = numpy.asarray(anchors, dtype = float).reshape(count, 4)
+    sizes = numpy.asarray(sizes, dtype = float).reshape(count, 2)
+    x1, y1, x2, y2 = (anchors[:, index, None] for index in range(4))
+    w, h = sizes[:, 0, None], sizes[:, 1, None]
+    cx = numpy.hstack((x1, x1, x2 + gap, x1 - gap - w, x2 - w, x2 - w, x2 + gap, x1 - gap - w))
+    cy = numpy.hstack((y2 + gap, y1 - gap - h, y1, y1, y2 + gap, y1 - gap - h, y2 - h, y2 - h))
+    cx2, cy2 = cx + w, cy + h                                                   #   All candidates of all labels at once
+    if region == None:
+        inside = numpy.ones(cx.shape, dtype = bool)
+    else:
+        inside = (cx >= region[0]) & (cy >= region[1]) & (cx2 <= region[2]) & (cy2 <= region[3])
+    spans = numpy.floor(numpy.hstack((cx.min(axis = 1, keepdims = True), cy.min(axis = 1, keepdims = True),
+                                      cx2.max(axis = 1, keepdims = True), cy2.max(axis = 1, keepdims = True))) /
+                        cellsize).astype(int).tolist()                          #   Grid cells around all candidates of a label
+    boxes = numpy.empty((len(placed) + count, 4))                               #   Placed labels, grown in place
+    boxes[:len(placed)] = numpy.asarray(placed, dtype = float).reshape(len(placed), 4)
+    grid = {}                                                                   #   (column, row) -> indices into boxes
+    def insert(index, box):
+        x1, y1, x2, y2 = (int(math.floor(value / cellsize)) for value in box)
+        for column in range(x1, x2 + 1):
+            for row in range(y1, y2 + 1):
+                grid.setdefault((column, row), []).append(index)
+    for index in range(len(placed)):
+        insert(index, boxes[index])
+    used = len(placed)
+    positions = []
+    for index in range(count):
+        free = inside[index].copy()
+        if used > 0 and free.any():
+            column1, row1, column2, row2 = spans[index]
+            near = [other for column in range(column1, column2 + 1) for row in range(row1, row2 + 1)
+                    for other in grid.get((column, row), ())]
+            if len(near) > 0:                                                   #   Only the labels close by are tested
+                px1, py1, px2, py2 = boxes[near].T                              #   Duplicates do not change any()
+                free &= ~((cx[index, :, None] < px2) & (cx2[index, :, None] > px1) &
+                          (cy[index, :, None] < py2) & (cy2[index, :, None] > py1)).any(axis = 1)
+        if not free.any():                                                      #   No room left for this label
+            positions.append(None)
+            continue
+        choice = int(free.argmax())
+        boxes[used] = (cx[index, choice], cy[index, choice], cx2[index, choice], cy2[index, choice])
+        insert(used, boxes[used])
+        used += 1
+        positions.append((float(cx[index, choice]), float(cy[index, choice])))
+    return positions
+
+
+def _place_python(anchors, sizes, placed, region, gap, cellsize = 64):
+    """ place_labels() without numpy, placed labels are found through a uniform grid """
+    grid = {}
+    def cells(box):
+        x1, y1, x2, y2 = (int(math.floor(value / cellsize)) for value in box)
+        return [(column, row) for column in range(x1, x2 + 1) for row in range(y1, y2 + 1)]
+    def collides(box):
+        for cell in cells(box):
+            for other in grid.get(cell, ()):
+                if box[0] < other[2] and box[2] > other[0] and box[1] < other[3] and box[3] > other[1]:
+                    return True
+        return False
+    for box in placed:
+        for cell in cells(box):
+            grid.setdefault(cell, []).append(box)
+    positions = []
+    for bbox, size in zip(anchors, sizes):
+        position = None
+        for x, y in _candidates(bbox, size, gap):
+            box = (x, y, x + size[0], y + size[1])
+            if region != None and (x < region[0] or y < region[1] or box[2] > region[2] or box[3] > region[3]):
+                continue
+            if not collides(box):
+                position = (x, y)
+                for cell in cells(box):
+                    grid.setdefault(cell, []).append(box)
+                break
+        positions.append(position)
+    return positions
+
+
+def place_labels(anchors, sizes, placed = (), region = None, gap = 4):
+    """ return the top left corner of a label of each size in <sizes> next to each bbox in <anchors>,
+        no label overlaps another one or a box in <placed>, None when no candidate is free.
+        Labels are placed in the given order, all of them inside <region> (x1, y1, x2, y2) if given.
+        Uses numpy when it is installed """
+    if len(anchors) == 0:
+        return []
+    if numpy != None:
+        return _place_numpy(anchors, sizes, placed, region, gap)
+    return _place_python(anchors, sizes, placed, region, gap)
+
+
+
+class TextCache(object):
+    """ Memo of texts computed by callable ToolTip texts, evicted after their time to live
+        Usage: _text_cache.get(<key>)                   returns (True, <text>) or (False, None)
+               _text_cache.put(<key>, <text>, <ttl>)
+        <key>     = the callable computing the text
+        <ttl>     = time in seconds the text is kept, 0 to not keep it at all
+        At most <maxsize> texts are kept, the least recently used are evicted first.
+    """
+
+    def __init__(self, maxsize = 1024):
+        """ TextCache initialisation """
+        self.maxsize = maxsize
+        self.entries = collections.OrderedDict()                                #   key -> (text, expiry)
+
+    def get(self, key):
+        """ return (True, text) if a text for <key> is alive, (False, None) otherwise """
+        entry = self.entries.get(key)
+        if entry == None:
+            return False, None
+        if entry[1] <= time.monotonic():                                        #   Time to live expired
+            del self.entries[key]
+            return False, None
+        self.entries.move_to_end(key)
+        return True, entry[0]
+
+    def put(self, key, text, ttl):
+        """ keep <text> for <key> during <ttl> seconds """
+        if not ttl or ttl <= 0:
+            return
+        self.entries[key] = (text, time.monotonic() + ttl)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last = False)
+
+    def clear(self):
+        """ drop every text """
+        self.entries.clear()
+
+    def drop(self, kind):
+        """ drop the texts of every key of type <kind> """
+        for key in [key for key in self.entries if isinstance(key, kind)]:
+            del self.entries[key]
+
+
+_text_cache = TextCache()
+
+
+
+class Stats(object):
+    """ Counters and timers of the ToolTip library
+        Usage: enable_stats()                    start counting, ToolTip.stats() returns the figures
+               enable_stats(log = True)          also log every figure to the "ToolTip" logger at DEBUG level
+               enable_stats(hooks = [<hook>])    call <hook>(<kind>, <name>, <value>) for every figure
+               enable_stats(False)               stop counting
+        Counters: windows_created, windows_destroyed, shown, hidden, handed_over, geometry_hits,
+                  geometry_misses, texts_computed, font_measures, tcl_errors, updates_applied,
+                  updates_coalesced
+        Timers:   placement, show, follow, overlay (seconds)
+        Instrumented code is guarded by "if _stats:", disabled stats cost one global lookup.
+    """
+
+    def __init__(self, hooks = None):
+        """ Stats initialisation """
+        self.hooks = list(hooks or [])
+        self.reset()
+
+    def reset(self):
+        """ set every counter and timer back to zero """
+        self.counters = collections.Counter()
+        self.timers = {}                                                        #   name -> [count, total, max]
+
+    def count(self, name, value = 1):
+        """ add <value> to counter <name> """
+        self.counters[name] += value
+        for hook in self.hooks:
+            hook("count", name, value)
+
+    def time(self, name, seconds):
+        """ add a measurement of <seconds> to timer <name> """
+        timer = self.timers.get(name)
+        if timer == None:
+            timer = self.timers[name] = [0, 0.0, 0.0]
+        timer[0] += 1
+        timer[1] += seconds
+        timer[2] = max(timer[2], seconds)
+        for hook in self.hooks:
+            hook("time", name, seconds)
+
+    def snapshot(self):
+        """ return the counters and timers as a dict """
+        return {"counters": dict(self.counters),
+                "timers": dict((name, {"count": count, "total": total, "max": longest,
+                                       "mean": total / count if count else 0.0})
+                               for name, (count, total, longest) in self.timers.items())}
+
+
+def _log_hook(kind, name, value):
+    """ Stats hook logging every figure """
+    log.debug("%s %s %s", kind, name, value)
+
+
+_stats = None                                                                   #   Stats while enabled, None otherwise
+
+
+def enable_stats(enabled = True, log = False, hooks = None):
+    """ enable or disable the instrumentation of the ToolTip library, return the Stats object or None """
+    global _stats
+    if enabled == False:
+        _stats = None
+        return None
+    _stats = Stats(hooks)
+    if log == True:
+        _stats.hooks.append(_log_hook)
+    return _stats
+
+
+def _error(message, *args):
+    """ an error has been caught and is not raised, count and log it """
+    if _stats:
+        _stats.count("tcl_errors")
+    log.debug(message, *args, exc_info = True)
+
+
+class ToolTipPool(object):
+    """ Pool of pre-built, withdrawn ToolTip windows, one pool per Tk root
+        Usage: ToolTipPool.get(<widget>)            returns the pool of the root <widget> belongs to
+               ToolTipPool.get(<widget>).resize(<size>)
+               ToolTipPool.get(<widget>).destroy()
+               ToolTipPool.destroy_all()
+        <size>    = number of withdrawn windows kept ready for reuse, default ToolTipPool.default_size
+    """
+
+    default_size = 4                                                            #   Size of newly created pools
+    prefix = ".tooltip"                                                         #   Path of every pooled window starts with it
+    _pools = {}                                                                 #   Tk root -> ToolTipPool
+    _counter = 0                                                                #   Window names are never reused, not even by a new pool
+
+    def __init__(self, root, size=None):
+        """ Pool initialisation, root is mandatory """
+        self.root = root
+        self.size = self.default_size if size == None else size
+        if type(self.size) != int or self.size < 0:                             #   Positive integer expected
+            raise TypeError("<size> must be a positive integer")
+        self.free = []                                                          #   Withdrawn windows ready for use
+        self.used = set()                                                       #   Windows currently handed out
+        self.paths = set()                                                      #   Paths of the pooled windows and labels
+        self.root.bind("<Destroy>", self._root_destroyed, add = '+')            #   Forget the pool with its root
+        self.resize(self.size)
+
+    @classmethod
+    def get(cls, widget, size=None):
+        """ return the pool of the Tk root <widget> belongs to, create it if needed """
+        root = widget._root()
+        pool = cls._pools.get(root)
+        if pool == None:
+            pool = cls._pools[root] = cls(root, size)
+        elif size != None:
+            pool.resize(size)
+        return pool
+
+    @classmethod
+    def destroy_all(cls):
+        """ destroy every pool and all of its windows """
+        for pool in list(cls._pools.values()):
+            pool.destroy()
+
+    def _build(self):
+        """ create one withdrawn, frameless ToolTip window with its label """
+        ToolTipPool._counter += 1
+        if _stats:
+            _stats.count("windows_created")
+        tw = tk.Toplevel(self.root, name = "%s%d" % (self.prefix[1:], ToolTipPool._counter))
+        tw.withdraw()                                                           #   Never mapped until used
+        tw.overrideredirect(True)                                               #   No frame for the widget
+        tk.Label(tw, name = 'tooltiplabel',                                     #   Label in the widget
+                 relief = 'ridge',                                              #   Display Style
+                 borderwidth = LABEL_BORDER,                                    #   1 Pixel Border
+                 padx = 1, pady = 1).pack(ipadx = LABEL_IPADX)                  #   Padding assumed by _measure()
+        self.paths.update((tw._w, tw.children['tooltiplabel']._w))
+        return tw
+
+    def _destroy(self, tw):
+        """ destroy a pooled window """
+        self.paths.difference_update((tw._w, tw._w + ".tooltiplabel"))
+        tw.destroy()
+
+    def owns(self, widget):
+        """ return True if <widget> (a widget or its path) is a pooled window or its label """
+        return str(widget) in self.paths
+
+    def resize(self, size):
+        """ set the number of windows kept ready, build or destroy spare ones as required """
+        if type(size) != int or size < 0:                                       #   Positive integer expected
+            raise TypeError("<size> must be a positive integer")
+        self.size = size
+        while len(self.free) + len(self.used) < self.size:
+            self.free.append(self._build())
+        while len(self.free) > 0 and len(self.free) + len(self.used) > self.size:
+            self._destroy(self.free.pop())
+            if _stats:
+                _stats.count("windows_destroyed")
+
+    def acquire(self):
+        """ return a withdrawn ToolTip window, its label is available as tw.children['tooltiplabel'] """
+        tw = self.free.pop() if len(self.free) > 0 else self._build()
+        self.used.add(tw)
+        return tw
+
+    def release(self, tw, hidden = False):
+        """ hide a window handed out by acquire() and keep it for reuse, <hidden> if ::tkinter_tooltip::hide did already """
+        if tw not in self.used:                                                 #   Not handed out by this pool, drop it
+            try:
+                tw.destroy()
+            except tk.TclError:
+                _error("ToolTip window already gone")
+            return
+        self.used.discard(tw)
+        try:
+            if not hidden:
+                tw.withdraw()                                                   #   Hide ToolTip
+            if len(self.free) + len(self.used) < self.size:
+                self.free.append(tw)
+            else:
+                self._destroy(tw)                                               #   Pool is full, drop the spare
+                if _stats:
+                    _stats.count("windows_destroyed")
+        except tk.TclError:
+            _error("ToolTip window already gone with its root")
+
+    def destroy(self):
+        """ destroy every window of the pool and forget the pool, a visible ToolTip is hidden first """
+        scheduler = HoverScheduler._schedulers.get(self.root)
+        if scheduler != None:
+            scheduler.hide()                                                    #   Its window goes back to this pool
+        for tw in self.free + list(self.used):
+            try:
+                self._destroy(tw)
+            except tk.TclError:
+                _error("ToolTip window already gone with its root")
+        self.free = []
+        self.used = set()
+        if self._pools.get(self.root) is self:
+            del self._pools[self.root]
+
+    def _root_destroyed(self, event):
+        """ Tk root has been destroyed, its windows are gone too """
+        if event.widget is self.root:
+            self.free = []
+            self.used = set()
+            self.paths = set()
+            if self._pools.get(self.root) is self:
+                del self._pools[self.root]
+
+
+
+class CanvasTipItems(object):
+    """ Rectangle and text item pair drawing ToolTips on the canvas itself, one reusable pair per canvas
+        Usage: CanvasTipItems.get(<canvas>)         returns the pair of <canvas>, created on first use
+
+        Used instead of a pooled Toplevel by ToolTips created with incanvas = True. Showing a
+        ToolTip only configures, moves (coords) and raises the items, no window is mapped and the
+        window manager is not involved. The items are disabled so they never take the mouse
+        over from the canvas item the ToolTip belongs to.
+
+        The pair is an ordinary part of the canvas and carries the implicit "all" tag:
+        canvas.delete("all") deletes it, move("all") / scale("all") move it and find_all()
+        returns it. A deleted pair is created again by the next place().
+    """
+
+    tag = "tooltip_incanvas"                                                    #   Tag of both items
+    _pairs = {}                                                                 #   canvas -> CanvasTipItems
+
+    def __init__(self, canvas):
+        """ CanvasTipItems initialisation, canvas is mandatory """
+        self.canvas = canvas
+        self.text = ""                                                          #   Text currently drawn
+        self.fg = "black"
+        self.bg = "lightyellow"
+        self.font = "TkDefaultFont"
+        self.rectangle = canvas.create_rectangle(0, 0, 0, 0, tags = self.tag, state = tk.HIDDEN,
+                                                 width = LABEL_BORDER)
+        self.label = canvas.create_text(0, 0, tags = self.tag, state = tk.HIDDEN,
+                                        anchor = tk.NW, justify = tk.LEFT)
+        self.canvas.bind("<Destroy>", self._canvas_destroyed, add = '+')
+
+    @classmethod
+    def get(cls, canvas):
+        """ return the item pair of <canvas>, create it if needed """
+        items = cls._pairs.get(canvas)
+        if items == None:
+            items = cls._pairs[canvas] = cls(canvas)
+        return items
+
+    def configure(self, text = None, fg = None, bg = None, font = None):
+        """ change the text, colors and font of the pair, drawn by the next place() """
+        if text != None:
+            self.text = text
+        if fg != None:
+            self.fg = fg
+        if bg != None:
+            self.bg = bg
+        if font != None:
+            self.font = font
+
+    def place(self, x, y, width, height, ms = -1, command = ""):
+        """ move the pair to canvas coordinates <x>, <y>, size it to <width> x <height> and show it on top.
+            The items are disabled, visible but never picked by the mouse. Items deleted from the canvas,
+            i.e. by canvas.delete("all"), are created again. The pair is hidden after <ms> milliseconds
+            (0 never, -1 keeps the running timer), then Tcl <command> is called. Return the timer id """
+        ids = _tcl(self.canvas).call("::tkinter_tooltip::draw", self.canvas._w, self.tag, self.rectangle, self.label,
+                                     self.text, self.fg, self.bg, self.font, x, y, width, height,
+                                     LABEL_PADDING[0], LABEL_PADDING[1], LABEL_BORDER, ms, command)
+        rectangle, label, timer = self.canvas.tk.splitlist(ids)
+        self.rectangle, self.label = int(rectangle), int(label)
+        return str(timer)
+
+    def release(self, hidden = False):
+        """ hide the pair and keep it for reuse, <hidden> if ::tkinter_tooltip::hide did already """
+        if not hidden:
+            self.canvas.itemconfigure(self.tag, state = tk.HIDDEN)
+
+    def _canvas_destroyed(self, event):
+        """ canvas has been destroyed, its items are gone too """
+        if event.widget is self.canvas and self._pairs.get(self.canvas) is self:
+            del self._pairs[self.canvas]
+
+
+
+class GeometryCache(object):
+    """ Screen and widget geometry of one Tk root, filled on demand
+        Usage: GeometryCache.get(<widget>).screen()          returns (width, height) of the screen
+               GeometryCache.get(<widget>).geometry(<widget>) returns (rootx, rooty, width, height)
+               GeometryCache.get(<widget>).view(<canvas>, <scrollbarX>, <scrollbarY>)
+                                                             returns the scroll fractions of <canvas>
+        Widget geometry is dropped on any <Configure> or <Map> event of the application, scroll
+        fractions whenever the canvas scrolls. ToolTip windows do not invalidate the cache.
+    """
+
+    _caches = {}                                                                #   Tk root -> GeometryCache
+
+    def __init__(self, root):
+        """ GeometryCache initialisation, root is mandatory """
+        self.root = root
+        self.screen_size = None                                                 #   (width, height) of the screen
+        self.widgets = weakref.WeakKeyDictionary()                              #   widget -> (rootx, rooty, width, height)
+        self.views = weakref.WeakKeyDictionary()                                #   canvas -> (xfraction, yfraction)
+        self.watched = weakref.WeakKeyDictionary()                              #   canvas -> names of its scroll command wrappers
+        self.root.bind_all("<Configure>", self.invalidate, add = '+')           #   Any widget moved or resized
+        self.root.bind_all("<Map>", self.invalidate, add = '+')                 #   Any widget (re)mapped
+        self.root.bind("<Destroy>", self._root_destroyed, add = '+')
+
+    @classmethod
+    def get(cls, widget):
+        """ return the cache of the Tk root <widget> belongs to, create it if needed """
+        root = widget._root()
+        cache = cls._caches.get(root)
+        if cache == None:
+            cache = cls._caches[root] = cls(root)
+        return cache
+
+    def invalidate(self, event = None):
+        """ drop the cached widget geometry """
+        if event != None:
+            pool = ToolTipPool._pools.get(self.root)
+            if pool != None and pool.owns(event.widget):
+                return                                                          #   A ToolTip window has been shown
+        self.widgets.clear()
+        self.views.clear()
+
+    def screen(self):
+        """ return (width, height) of the screen """
+        if self.screen_size == None:
+            self.screen_size = (self.root.winfo_screenwidth(),                  #   Get screen resolution width
+                                self.root.winfo_screenheight())                 #   Get screen resolution height
+        return self.screen_size
+
+    def geometry(self, widget):
+        """ return (rootx, rooty, width, height) of <widget> """
+        values = self.widgets.get(widget)
+        if values == None:
+            if _stats:
+                _stats.count("geometry_misses")
+            values = self.widgets[widget] = (widget.winfo_rootx(),              #   Get widget X Position (left)
+                                             widget.winfo_rooty(),              #   Get widget Y Position (Top)
+                                             widget.winfo_width(),              #   Get widget width
+                                             widget.winfo_height())             #   Get widget height
+        elif _stats:
+            _stats.count("geometry_hits")
+        return values
+
+    def view(self, canvas, scrollbarX, scrollbarY):
+        """ return the (xfraction, yfraction) the canvas is scrolled to, read from its scrollbars """
+        values = self.views.get(canvas)
+        if values == None:
+            self._watch(canvas)
+            if _stats:
+                _stats.count("geometry_misses")
+            values = self.views[canvas] = (scrollbarX.get()[0], scrollbarY.get()[0])
+        return values
+
+    def _watch(self, canvas):
+        """ chain the scroll commands of <canvas> to drop its scroll fractions when it scrolls,
+            chain them again if the application has configured other scroll commands since """
+        names = []
+        for option, name in zip(("xscrollcommand", "yscrollcommand"), self.watched.get(canvas, (None, None))):
+            current = str(canvas.cget(option))
+            if current != name:                                                 #   Not watched yet, or replaced
+                command = canvas.tk.splitlist(current)
+                def scrolled(*args, command = command):
+                    self.views.pop(canvas, None)
+                    if len(command) > 0:
+                        canvas.tk.call(command + args)                          #   Keep the original scroll command
+                name = canvas.register(scrolled)
+                canvas.configure(**{option: name})
+            names.append(name)
+        self.watched[canvas] = tuple(names)
+
+    def _root_destroyed(self, event):
+        """ Tk root has been destroyed, forget its cache """
+        if event.widget is self.root and self._caches.get(self.root) is self:
+            del self._caches[self.root]
+
+
+
+class HoverScheduler(object):
+    """ One hover timer per Tk root deciding when ToolTips are shown and hidden
+        Usage: HoverScheduler.get(<widget>).configure(delay = <delay>, warm = <warm>)
+        <delay>   = time in milliseconds the mouse has to rest on a widget before its ToolTip
+                    is shown, default HoverScheduler.default_delay (0, shown right away)
+        <warm>    = time in milliseconds after a ToolTip has been hidden during which the next
+                    ToolTip is shown without delay, default HoverScheduler.default_warm
+
+        Only one timer is active at any time, either the pending show or the auto-hide of the
+        visible ToolTip. Moving from one ToolTip to the next hands the visible window over,
+        only its content and position change. A fast sweep over many widgets shows nothing.
+        The auto-hide and the hide after <Leave> are Tcl timers started by the ::tkinter_tooltip
+        procs within the call showing the ToolTip or handling <Leave>, no Python callback runs
+        until the ToolTip is actually hidden.
+    """
+
+    default_delay = 0                                                           #   Show delay of newly created schedulers
+    default_warm = 300                                                          #   Warm period of newly created schedulers
+    _schedulers = {}                                                            #   Tk root -> HoverScheduler
+
+    def __init__(self, root):
+        """ HoverScheduler initialisation, root is mandatory """
+        self.root = root
+        self.delay = self.default_delay
+        self.warm = self.default_warm
+        self.timer = None                                                       #   after(...) handler of the pending show
+        self.hiding = None                                                      #   Id of the Tcl auto-hide or idle hide timer
+        self.time = -1                                                          #   ms passed to the procs by the next show, -1 keeps the timer
+        self.command = self.root.register(self._hidden)                         #   Called by ::tkinter_tooltip::hide
+        self.pending = None                                                     #   (tip, show, event) waiting for the delay
+        self.shown = None                                                       #   ToolTip currently visible
+        self.shown_with = None                                                  #   (show, event) it has been displayed with
+        self.hidden_at = None                                                   #   time.monotonic() of the last hide
+        self.root.bind("<Destroy>", self._root_destroyed, add = '+')
+
+    @classmethod
+    def get(cls, widget):
+        """ return the scheduler of the Tk root <widget> belongs to, create it if needed """
+        root = widget._root()
+        scheduler = cls._schedulers.get(root)
+        if scheduler == None:
+            scheduler = cls._schedulers[root] = cls(root)
+        return scheduler
+
+    def configure(self, delay = None, warm = None):
+        """ configuration of the scheduler """
+        if delay != None:
+            if type(delay) != int:                                              #   Integer expected
+                raise TypeError("<delay> must be an integer")
+            self.delay = delay
+        if warm != None:
+            if type(warm) != int:                                               #   Integer expected
+                raise TypeError("<warm> must be an integer")
+            self.warm = warm
+
+    def enter(self, tip, show, event = None):
+        """ mouse entered <tip>, <show>(<event>) displays it and returns False on error """
+        self._cancel()
+        if self.shown != None and self.shown is not tip:                        #   Hand the visible window over
+            self.shown._cancel_text()
+            self.shown._cancel_follow()
+            if self.shown.tw != None:
+                tip.tw, self.shown.tw = self.shown.tw, None
+                if _stats:
+                    _stats.count("handed_over")
+            self.shown = None
+            self._show(tip, show, event)
+        elif self.shown is tip or self.delay <= 0 or self._is_warm():
+            self._show(tip, show, event)
+        else:
+            self.pending = (tip, show, event)
+            self.timer = self.root.after(self.delay, self._timeout)             #   Start show timer
+
+    def leave(self, tip):
+        """ mouse left <tip>, hide it once no other ToolTip took its window over """
+        if self.pending != None and self.pending[0] is tip:
+            self._cancel()
+        if self.shown is tip:
+            self._cancel()
+            try:
+                self.hiding = tip._hide_idle(self.command)                      #   Next <Enter> is already queued, if any
+            except tk.TclError:
+                _error("ToolTip could not be hidden")
+                self._hide()
+
+    def refresh(self, tip):
+        """ display <tip> again in place if it is visible, i.e. its text has changed """
+        if self.shown is tip and self.pending == None:
+            show, event = self.shown_with
+            self.time = -1                                                      #   Auto-hide keeps running
+            if show(event) == False:
+                self.shown = None
+
+    def forget(self, tip):
+        """ <tip> is being removed, drop it whether it is pending or visible """
+        if self.pending != None and self.pending[0] is tip:
+            self._cancel()
+        if self.shown is tip:
+            self._cancel()
+            self._hide()
+
+    def hide(self):
+        """ hide the visible ToolTip right away """
+        self._cancel()
+        if self.shown != None:
+            self._hide()
+
+    def _cancel(self):
+        """ cancel the active timer """
+        if self.timer != None:
+            self.root.after_cancel(self.timer)
+            self.timer = None
+        if self.hiding != None:
+            self.root.tk.call("after", "cancel", self.hiding)                   #   Tcl timer, no Python callback to delete
+            self.hiding = None
+        self.pending = None
+
+    def _timeout(self):
+        """ the show delay has expired, show the pending ToolTip """
+        self.timer = None
+        if self.pending != None:
+            tip, show, event = self.pending
+            self.pending = None
+            self._show(tip, show, event)
+
+    def _hidden(self):
+        """ ::tkinter_tooltip::hide has hidden the visible ToolTip, after its auto-hide or its <Leave> """
+        self.hiding = None
+        if self.shown != None:
+            self._hide(hidden = True)
+
+    def _show(self, tip, show, event):
+        """ display <tip>, its auto-hide timer is started by the same ::tkinter_tooltip call """
+        start = _stats and time.perf_counter()
+        self.time = tip.time
+        shown = show(event)
+        if _stats and start:
+            _stats.time("show", time.perf_counter() - start)
+        if shown == False:
+            self.hidden_at = time.monotonic()
+            return
+        self.shown = tip
+        self.shown_with = (show, event)
+
+    def _hide(self, hidden = False):
+        """ hide the visible ToolTip, <hidden> if ::tkinter_tooltip::hide did already """
+        tip = self.shown
+        self.shown = None
+        self.hidden_at = time.monotonic()
+        tip._cancel_text()                                                      #   Mouse left before the text was computed
+        tip._cancel_follow()
+        try:
+            if tip.tw != None:                                                  #   Check if Already hidden
+                tip._release_window(hidden)                                     #   Hide ToolTip
+                if _stats:
+                    _stats.count("hidden")
+        except tk.TclError:
+            _error("ToolTip could not be hidden")                               #   if bad window path nothing happens
+
+    def _is_warm(self):
+        """ return True if a ToolTip has been hidden less than <warm> ms ago """
+        return (self.hidden_at != None and
+                (time.monotonic() - self.hidden_at) * 1000 < self.warm)
+
+    def _root_destroyed(self, event):
+        """ Tk root has been destroyed, forget its scheduler """
+        if event.widget is self.root and self._schedulers.get(self.root) is self:
+            del self._schedulers[self.root]
+
+
+
+class ToolTipStyle(object):
+    """ Named look of ToolTips, shared by every ToolTip using it
+        Usage: ToolTipStyle(<name>, <font>, <fg>, <bg>, <time>)
+               ToolTip(<widget>, text = <text>, style = <name>)
+               ToolTipStyle.get(<name>).configure(<font>, <fg>, <bg>, <time>)
+        <name>    = required, name of the style, ToolTipStyle.get("default") is used by default
+        <font>    = font to be used, by default ("arial","8","normal")
+        <fg>      = foreground color (text), default 'black'
+        <bg>      = background color, default 'lightyellow'
+        <time>    = Time in milliseconds until fase out of the ToolTip, default 2000ms
+
+        Each style owns one named tkinter.font.Font per Tk root. configure() changes the style
+        of every ToolTip using it at once, no ToolTip is visited. Font, fg, bg or time given
+        to a ToolTip itself override its style.
+    """
+
+    _styles = {}                                                                #   name -> ToolTipStyle
+    _overlays = weakref.WeakSet()                                               #   AnnotationOverlays, changed by configure()
+
+    def __init__(self, name, font=('arial','8','normal'), fg='black', bg='lightyellow', time=2000):
+        """ ToolTipStyle initialisation, name is mandatory """
+        self.name = name
+        self.font = None
+        self.fg = None
+        self.bg = None
+        self.time = None
+        self.fonts = weakref.WeakKeyDictionary()                                #   Tk root -> named tkinter.font.Font
+        self.configure(font = font, fg = fg, bg = bg, time = time)
+        self._styles[name] = self
+
+    @classmethod
+    def get(cls, name):
+        """ return the style called <name> """
+        try:
+            return cls._styles[name]
+        except KeyError:
+            raise KeyError("no ToolTipStyle named %r" % (name,))
+
+    def configure(self, font=None, fg=None, bg=None, time=None):
+        """ configuration of the style, every ToolTip using it is changed """
+        if font != None:
+            if type(font) != tuple:                                             #   tuple (font) expected
+                raise TypeError("<font> must be a font tuple")
+            self.font = font                                                    #   Font to be used
+            for root, named in list(self.fonts.items()):                        #   One named font per root
+                try:
+                    root.tk.call("font", "configure", named.name,
+                                 *root.tk.splitlist(root.tk.call("font", "actual", font)))
+                except tk.TclError:
+                    _error("ToolTipStyle %r: font could not be changed", self.name)
+        if time != None:
+            if type(time) != int:                                               #   Integer expected
+                raise TypeError("<time> must be an integer")
+            self.time = time                                                    #   Display time for ToolTip
+        if fg != None:
+            self.fg = fg                                                        #   foreground color (textcolor)
+        if bg != None:
+            self.bg = bg                                                        #   background color
+        for scheduler in list(HoverScheduler._schedulers.values()):             #   Visible ToolTip follows at once
+            if scheduler.shown != None and scheduler.shown.style is self:
+                scheduler.refresh(scheduler.shown)
+        if font != None or fg != None or bg != None:
+            for overlay in list(self._overlays):                                #   Pinned labels follow too
+                if overlay.shown and overlay.tips.tip.style is self:
+                    try:
+                        if font != None and overlay.tips.tip._font == None:     #   Label sizes change, place all again
+                            overlay.update(full = True)
+                        else:
+                            overlay.restyle()
+                    except tk.TclError:
+                        _error("ToolTipStyle %r: overlay could not be changed", self.name)
+
+    def named_font(self, widget):
+        """ return the name of the font of the style for the Tk root of <widget> """
+        root = widget._root()
+        named = self.fonts.get(root)
+        if named == None:
+            named = self.fonts[root] = tkfont.Font(root = root, font = self.font)
+        return named.name
+
+
+ToolTipStyle("default")
+
+
+
+class ToolTipCatalog(object):
+    """ Memory-mapped catalog of ToolTip texts looked up by key
+        Usage: ToolTipCatalog.build(<path>, {<key>: <text>, ...})     write a catalog file
+               ToolTipCatalog.activate(ToolTipCatalog(<path>))       use it for every CatalogKey
+               ToolTip(<widget>, text = CatalogKey(<key>))
+        <path>    = catalog file, one per language
+        <key>     = message key, str
+
+        The file holds a sorted index of fixed size records followed by the UTF-8 texts. It is
+        opened with mmap and searched in place, texts are decoded on first use and kept in a
+        small LRU shared by the threads of an executor. Switching language is a single
+        activate(...), no ToolTip is changed.
+    """
+
+    MAGIC = b"TTCAT001"
+    HEADER = struct.Struct("<8sI")                                              #   magic, number of entries
+    RECORD = struct.Struct("<IIII")                                             #   key offset, key length, text offset, text length
+
+    _active = None                                                              #   Catalog used by CatalogKey
+
+    def __init__(self, path, cachesize = 256):
+        """ ToolTipCatalog initialisation, path is mandatory """
+        self.path = path
+        self.cachesize = cachesize
+        self.cache = collections.OrderedDict()                                  #   key -> decoded text, least recently used first
+        self.lock = threading.Lock()                                            #   CatalogKey may run on executor threads
+        with open(path, "rb") as catalog:
+            self.map = mmap.mmap(catalog.fileno(), 0, access = mmap.ACCESS_READ)
+        magic, self.count = self.HEADER.unpack_from(self.map, 0)
+        if magic != self.MAGIC:
+            self.map.close()
+            raise ValueError("%s is not a ToolTip catalog" % (path,))
+
+    @classmethod
+    def build(cls, path, texts):
+        """ write the catalog file <path> from the mapping <texts> of key -> text """
+        entries = sorted((str(key).encode("utf-8"), str(text).encode("utf-8")) for key, text in texts.items())
+        offset = cls.HEADER.size + cls.RECORD.size * len(entries)
+        records, data = [], []
+        for key, text in entries:
+            records.append(cls.RECORD.pack(offset, len(key), offset + len(key), len(text)))
+            data.append(key)
+            data.append(text)
+            offset += len(key) + len(text)
+        with open(path, "wb") as catalog:
+            catalog.write(cls.HEADER.pack(cls.MAGIC, len(entries)))
+            catalog.write(b"".join(records))
+            catalog.write(b"".join(data))
+
+    @classmethod
+    def activate(cls, catalog):
+        """ use <catalog> for every CatalogKey, visible ToolTips and pinned labels change at once """
+        cls._active = catalog
+        _text_cache.drop(CatalogKey)                                            #   Texts of the previous catalog
+        for scheduler in list(HoverScheduler._schedulers.values()):
+            if scheduler.shown != None and isinstance(scheduler.shown.text, CatalogKey):
+                scheduler.shown._cancel_text()                                  #   Text being computed from the previous catalog
+                scheduler.refresh(scheduler.shown)
+        for overlay in list(ToolTipStyle._overlays):                            #   Pinned labels change at once too
+            if overlay.shown and any(isinstance(text, CatalogKey) for text in overlay.tips.texts.values()):
+                overlay._cancel_texts()
+                try:
+                    overlay.update(full = True)
+                except tk.TclError:
+                    _error("ToolTipCatalog: overlay could not be redrawn")
+
+    @classmethod
+    def active(cls):
+        """ return the catalog used by CatalogKey, or None """
+        return cls._active
+
+    def _key(self, index):
+        """ return the encoded key of record <index> """
+        offset, length = self.RECORD.unpack_from(self.map, self.HEADER.size + self.RECORD.size * index)[:2]
+        return self.map[offset:offset + length]
+
+    def get(self, key, default = None):
+        """ return the text of <key>, <default> if the catalog has none, safe from any thread """
+        with self.lock:
+            text = self.cache.get(key)
+            if text != None:
+                self.cache.move_to_end(key)
+                return text
+        wanted = key.encode("utf-8")
+        low, high = 0, self.count                                               #   Binary search of the sorted index
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < wanted:
+                low = middle + 1
+            else:
+                high = middle
+        if low == self.count or self._key(low) != wanted:
+            return default
+        offset, length = self.RECORD.unpack_from(self.map, self.HEADER.size + self.RECORD.size * low)[2:]
+        text = self.map[offset:offset + length].decode("utf-8")
+        with self.lock:
+            self.cache[key] = text
+            self.cache.move_to_end(key)
+            while len(self.cache) > self.cachesize:
+                self.cache.popitem(last = False)
+        return text
+
+    def close(self):
+        """ close the catalog file """
+        if ToolTipCatalog._active is self:
+            ToolTipCatalog._active = None
+        with self.lock:
+            self.cache.clear()
+        self.map.close()
+
+
+
+class CatalogKey(object):
+    """ Text of a ToolTip looked up by <key> in the active ToolTipCatalog when it is shown
+        Usage: ToolTip(<widget>, text = CatalogKey(<key>))
+        Without an active catalog, or if the catalog has no <key>, the key itself is shown.
+    """
+
+    __slots__ = ('key',)
+
+    def __init__(self, key):
+        """ CatalogKey initialisation, key is mandatory """
+        if type(key) != str:                                                    #   String expected
+            raise TypeError("<key> must be a string")
+        self.key = key
+
+    def __call__(self):
+        catalog = ToolTipCatalog._active
+        if catalog == None:
+            return self.key
+        return catalog.get(self.key, self.key)
+
+    def __eq__(self, other):
+        return isinstance(other, CatalogKey) and other.key == self.key
+
+    def __hash__(self):
+        return hash((CatalogKey, self.key))
+
+    def __repr__(self):
+        return "CatalogKey(%r)" % (self.key,)
+
+
+
+class UpdateQueue(object):
+    """ Thread-safe queue of ToolTip changes, applied on the Tk thread
+        Usage: UpdateQueue.get(<widget>, <interval>)      once, from the Tk thread
+               <tooltip>.post(text = <text>)             from any thread
+        <interval>  = time in milliseconds between two drains of the queue, default 50
+
+        Changes are kept per ToolTip (per item for CanvasToolTip), repeated changes before the
+        next drain are merged and only the last value is kept. A single periodic after(...) on
+        the Tk thread applies them, a visible ToolTip is updated in place.
+    """
+
+    default_interval = 50                                                       #   Drain interval of newly created queues
+    _queues = {}                                                                #   Tk root -> UpdateQueue
+
+    def __init__(self, root, interval = None):
+        """ UpdateQueue initialisation, root is mandatory, call from the Tk thread """
+        self.root = root
+        self.interval = self.default_interval if interval == None else interval
+        if type(self.interval) != int or self.interval <= 0:                    #   Positive integer expected
+            raise TypeError("<interval> must be a positive integer")
+        self.lock = threading.Lock()
+        self.updates = {}                                                       #   (target, args) -> changes
+        self.coalesced = 0                                                      #   Changes merged since the last drain
+        self.timer = self.root.after(self.interval, self._drain)
+        self.root.bind("<Destroy>", self._root_destroyed, add = '+')
+
+    @classmethod
+    def get(cls, widget, interval = None):
+        """ return the queue of the Tk root <widget> belongs to, create and start it if needed.
+            Must be called from the Tk thread the first time """
+        root = widget._root()
+        queue = cls._queues.get(root)
+        if queue == None:
+            queue = cls._queues[root] = cls(root, interval)
+        return queue
+
+    @classmethod
+    def of(cls, widget):
+        """ return the running queue of the Tk root <widget> belongs to, safe from any thread """
+        queue = cls._queues.get(widget._root())
+        if queue == None:
+            raise RuntimeError("no UpdateQueue for this Tk root, call UpdateQueue.get(<widget>) from the Tk thread first")
+        return queue
+
+    def put(self, target, *args, **changes):
+        """ queue target.config(*args, **changes), safe from any thread """
+        key = (target,) + args
+        with self.lock:
+            queued = self.updates.get(key)
+            if queued == None:
+                self.updates[key] = dict(changes)
+            else:
+                queued.update(changes)                                          #   Only the last value is kept
+                self.coalesced += 1
+
+    def _drain(self):
+        """ apply the queued changes on the Tk thread, a failing change is logged and the others applied """
+        try:
+            with self.lock:
+                updates, self.updates = self.updates, {}
+                coalesced, self.coalesced = self.coalesced, 0
+            for key, changes in updates.items():
+                target = key[0]
+                try:
+                    target.config(*key[1:], **changes)
+                    if isinstance(target, ToolTip):                             #   Visible ToolTip changes in place
+                        master = target._master()
+                        if master != None:
+                            HoverScheduler.get(master).refresh(target)
+                except Exception:
+                    log.warning("queued ToolTip change %r could not be applied", changes, exc_info = True)
+            if _stats and updates:
+                _stats.count("updates_applied", len(updates))
+                _stats.count("updates_coalesced", coalesced)
+        finally:
+            if self._queues.get(self.root) is self:                             #   Not stopped, root still alive
+                self.timer = self.root.after(self.interval, self._drain)
+            else:
+                self.timer = None
+
+    def stop(self):
+        """ stop draining the queue and forget it, call from the Tk thread """
+        if self.timer != None:
+            self.root.after_cancel(self.timer)
+            self.timer = None
+        if self._queues.get(self.root) is self:
+            del self._queues[self.root]
+
+    def _root_destroyed(self, event):
+        """ Tk root has been destroyed, forget its queue """
+        if event.widget is self.root and self._queues.get(self.root) is self:
+            del self._queues[self.root]
+
+
 
 class ToolTip(object):
     """ Class creating a tooltip on a widget
@@ -46,16 +1328,66 @@ class ToolTip(object):
         <scrollregiony>  = optional, if scrollbar Y-axis
         <scrollbarX>     = optional, if your canvas scrolls in the x-axis
         <scrollbarY>     = optional, if your canvas  scrolls in the Y-axis
-        <text>           = The text to be shown as ToolTip
-        <time>           = Time in milliseconds until fase out of the ToolTip, 2000ms.
+        <text>           = The text to be shown as ToolTip, or a callable returning it when the
+                           ToolTip is shown, i.e. CatalogKey(<key>) for a text of a ToolTipCatalog
+        <time>           = Time in milliseconds until fase out of the ToolTip, by default the
+                           time of <style>, 2000ms.
                            If <time> is less than 1000ms, the Tooltip is displayed
                            until the mouse has left the widget.
-        <font>    = font to be used, by default ("arial","8","normal")
-        <fg>      = foreground color (text), default 'black'
-        <bg>      = background color, default 'lightyellow'
+        <font>    = font to be used, by default the font of <style>, ("arial","8","normal")
+        <fg>      = foreground color (text), by default the one of <style>, 'black'
+        <bg>      = background color, by default the one of <style>, 'lightyellow'
+        <style>   = name of a ToolTipStyle or a ToolTipStyle, default "default"
+        <bind>    = bind the enter / leave handlers right away, default True.
+                    See ToolTip.register(...) to create many ToolTips at once
+        <executor>    = optional, concurrent.futures executor computing a callable <text> off the Tk
+                        thread, i.e. shared_executor(). Without it <text> is called on the Tk thread
+        <placeholder> = text shown while <executor> computes <text>, default '...'. If <text> raises,
+                        the error is logged and TEXT_FAILED is shown in its place
+        <ttl>         = time in seconds a computed <text> is kept in the memo cache, default 0 (not kept)
+        <maxwidth>    = optional, maximum width in pixels, longer lines are wrapped
+        <maxlines>    = optional, maximum number of lines shown, the rest is cut off and marked.
+                        Texts longer than LARGE_TEXT characters are always limited, by default to
+                        LARGE_WIDTH pixels and LARGE_LINES lines. Only the visible part is laid out
+        <follow>      = the ToolTip follows the mouse cursor while it is shown, default False
+        <followrate>  = moves per second at most while following, default 60. Motion in between
+                        is dropped, only the last position is used
+        <followtext>  = optional, callable(<event>) returning the text for the cursor position of
+                        <event> while following, the window is kept and only its text changes
+        <incanvas>    = canvas ToolTips only, draw the ToolTip as a rectangle and text item pair on
+                        <canvas> instead of in a Toplevel window, default False
+
+        Widgets are referenced weakly. When the widget (or canvas) is destroyed its ToolTips are
+        removed and their handlers unbound, see also unbind() and remove(). Deleting a canvas item
+        does not destroy anything Tk reports, ToolTips of deleted item ids are pruned now and then
+        while new ones are bound on the canvas, or right away with ToolTip.remove_items(<canvas>).
     """
 
-    def __init__(self, widget, window = None, canvas = None, scrollbarX = None, scrollbarY = None, scrollregionX = None, scrollregionY = None,  text='Default', time=2000, font=('arial','8','normal'), fg='black', bg='lightyellow'):
+    __slots__ = ('_widget', '_window', '_canvas', '_scrollbarX', '_scrollbarY', 'scrollregionX', 'scrollregionY',
+                 'text', '_time', '_font', '_fg', '_bg', 'style', 'executor', 'placeholder', 'ttl',
+                 'maxwidth', 'maxlines', 'follow', 'followrate', 'followtext', 'motion', 'frame', 'future', 'poll', 'result', 'incanvas', 'tw', 'bindings', '__weakref__')
+
+    _pending = weakref.WeakKeyDictionary()                                      #   container -> {ToolTip: None} waiting to be bound
+    _registry = weakref.WeakKeyDictionary()                                     #   bound widget or canvas -> {ToolTip: None}, in bind order
+
+    widget     = property(lambda self: _deref(self._widget),     lambda self, value: setattr(self, '_widget', _ref(value)))
+    window     = property(lambda self: _deref(self._window),     lambda self, value: setattr(self, '_window', _ref(value)))
+    canvas     = property(lambda self: _deref(self._canvas),     lambda self, value: setattr(self, '_canvas', _ref(value)))
+    scrollbarX = property(lambda self: _deref(self._scrollbarX), lambda self, value: setattr(self, '_scrollbarX', _ref(value)))
+    scrollbarY = property(lambda self: _deref(self._scrollbarY), lambda self, value: setattr(self, '_scrollbarY', _ref(value)))
+
+    time = property(lambda self: self.style.time if self._time == None else self._time,
+                    lambda self, value: setattr(self, '_time', value))
+    font = property(lambda self: self.style.font if self._font == None else self._font,
+                    lambda self, value: setattr(self, '_font', value))
+    fg   = property(lambda self: self.style.fg if self._fg == None else self._fg,
+                    lambda self, value: setattr(self, '_fg', value))
+    bg   = property(lambda self: self.style.bg if self._bg == None else self._bg,
+                    lambda self, value: setattr(self, '_bg', value))
+
+    def __init__(self, widget, window = None, canvas = None, scrollbarX = None, scrollbarY = None, scrollregionX = None, scrollregionY = None,  text='Default', time=None, font=None, fg=None, bg=None, bind=True,
+                 executor=None, placeholder='...', ttl=0, style="default", maxwidth=None, maxlines=None,
+                 follow=False, followrate=60, followtext=None, incanvas=False):
         """ ToolTip initialisation, widget is mandatory """
 
         self.window = window
@@ -70,49 +1402,187 @@ class ToolTip(object):
 
 
 
-        if type(text) != str:                                                   #   String expected
-            raise TypeError("<text> must be a string")
+        if type(text) != str and not callable(text):                            #   String or callable expected
+            raise TypeError("<text> must be a string or a callable")
         self.text = text                                                        #   Tooltip text
-        if type(time) != int:                                                   #   Integer expected
+        if time != None and type(time) != int:                                  #   Integer expected
             raise TypeError("<time> must be an integer")
-        self.time = time                                                        #   Display time for ToolTip
-        if type(font) != tuple:                                                 #   tuple (font) expected
+        self.time = time                                                        #   Display time for ToolTip, None from style
+        if font != None and type(font) != tuple:                                #   tuple (font) expected
             raise TypeError("<font> must be a font tuple")
-        self.font = font                                                        #   Font to be used
-        self.fg = fg                                                            #   foreground color (textcolor)
-        self.bg = bg                                                            #   background color
-
+        self.font = font                                                        #   Font to be used, None from style
+        self.fg = fg                                                            #   foreground color (textcolor), None from style
+        self.bg = bg                                                            #   background color, None from style
+        self.style = style if isinstance(style, ToolTipStyle) else ToolTipStyle.get(style)
+        if type(placeholder) != str:                                            #   String expected
+            raise TypeError("<placeholder> must be a string")
+        self.executor = executor                                                #   Computes callable text off the Tk thread
+        self.placeholder = placeholder                                          #   Shown while the text is computed
+        self.ttl = ttl                                                          #   Time to live of computed text
+        if maxwidth != None and (type(maxwidth) != int or maxwidth <= 0):       #   Positive integer expected
+            raise TypeError("<maxwidth> must be a positive integer")
+        self.maxwidth = maxwidth                                                #   Maximum width in pixels
+        if maxlines != None and (type(maxlines) != int or maxlines <= 0):       #   Positive integer expected
+            raise TypeError("<maxlines> must be a positive integer")
+        self.maxlines = maxlines                                                #   Maximum number of lines
+        if type(followrate) != int or followrate <= 0:                          #   Positive integer expected
+            raise TypeError("<followrate> must be a positive integer")
+        if followtext != None and not callable(followtext):                     #   Callable expected
+            raise TypeError("<followtext> must be a callable")
+        self.follow = follow                                                    #   Move with the mouse cursor
+        self.followrate = followrate                                            #   Moves per second at most
+        self.followtext = followtext                                            #   Text for the cursor position
+        self.motion = None                                                      #   Last <Motion> event not handled yet
+        self.frame = None                                                       #   after(...) handler of the next move
+        self.future = None                                                      #   Text being computed by <executor>
+        self.poll = None                                                        #   after(...) handler polling <future>
+        self.result = None                                                      #   Computed text not shown yet
+        if incanvas == True and canvas == None:                                 #   Items need a canvas
+            raise TypeError("<incanvas> requires a <canvas>")
+        self.incanvas = incanvas                                                #   Drawn as items on <canvas>
+        self.tw = None                                                          #   ToolTip window (or CanvasTipItems) while shown
+        self.bindings = []                                                      #   (widget, item, sequence, funcid) to unbind
+
+        if bind == True:
+            self._bind()
+
+    def _bind(self):
+        """ bind the enter / leave handlers of the ToolTip, no update of the widget is forced """
+        window, canvas = self.window, self.canvas
+        scrollbarX, scrollbarY = self.scrollbarX, self.scrollbarY
+        scrollregionX, scrollregionY = self.scrollregionX, self.scrollregionY
         if (window and canvas) == None:
-            self.widget.update()
-            self.widget.bind("<Enter>", self.tkinter_widget_enter, add = '+')   #   If mouse enters widget area
-            self.widget.bind("<Leave>", self.tkinter_widget_leave, add = '+')   #   If mouse leaves widget area
-            self.widget.focus_displayof()                                       #   Identify tkinter widget
+            self._add_binding(self.widget, None, "<Enter>", self.tkinter_widget_enter)  #   If mouse enters widget area
+            self._add_binding(self.widget, None, "<Leave>", self.tkinter_widget_leave)  #   If mouse leaves widget area
 
         elif ( ( (window and canvas) != None )
                          and
                ( (scrollbarX and scrollbarY and scrollregionX and
                   scrollregionY) == None ) ):
-            self.canvas.update()
-            self.canvas.focus_displayof()                                       #   Identify tkinter widget
-            self.canvas.tag_bind(self.widget, "<Enter>",                        #   If mouse enters widget area
-                                 self.canvas_widget_enter, add = '+')           #   add = '+', event handler added to action, not replaced any existing event handlers
-            self.canvas.tag_bind(self.widget, "<Leave>",                        #   If mouse leaves widget area
-                                 self.canvas_widget_leave, add = '+')            #   add = '+', event handler added to action, not replaced any existing event handlers
+            self._add_binding(self.canvas, self.widget, "<Enter>",              #   If mouse enters widget area
+                              self.canvas_widget_enter)
+            self._add_binding(self.canvas, self.widget, "<Leave>",              #   If mouse leaves widget area
+                              self.canvas_widget_leave)
 
         elif ( ( ( window and canvas) != None
                 and
                 (scrollbarX and scrollbarY and scrollregionX
                  and scrollregionY) != None ) ):
-            self.canvas.update()
-            self.canvas.focus_displayof()                                       #   Identify tkinter widget
-            self.canvas.tag_bind(self.widget, "<Enter>",                        #   If mouse enters widget area
-                                 self.canvas_widget_scroll_enter, add = '+')    #   add = '+', event handler added to action, not replaced any existing event handlers
-            self.canvas.tag_bind(self.widget, "<Leave>",                        #   If mouse leaves widget area
-                                 self.canvas_widget_scroll_leave, add = '+')    #   add = '+', event handler added to action, not replaced any existing event handlers
-            if debugging == True: self.canvas.bind('<ButtonPress>', self.onClick, add = '+')
+            self._add_binding(self.canvas, self.widget, "<Enter>",              #   If mouse enters widget area
+                              self.canvas_widget_scroll_enter)
+            self._add_binding(self.canvas, self.widget, "<Leave>",              #   If mouse leaves widget area
+                              self.canvas_widget_scroll_leave)
         else:
-            if debugging == True: print("Error")
-
+            log.warning("ToolTip %r: unsupported combination of window, canvas and scrollbars", self.widget)
+            return
+        if self.follow == True:                                                 #   Move with the mouse cursor
+            if canvas == None:
+                self._add_binding(self.widget, None, "<Motion>", self.follow_motion)
+            else:
+                self._add_binding(self.canvas, self.widget, "<Motion>", self.follow_motion)
+
+    def _add_binding(self, widget, item, sequence, handler):
+        """ bind <handler> with add = '+' and remember it for unbind(), <item> is the canvas item if any """
+        if item == None:
+            funcid = widget.bind(sequence, handler, add = '+')
+        else:
+            funcid = widget.tag_bind(item, sequence, handler, add = '+')        #   add = '+', event handler added to action, not replaced any existing event handlers
+        self.bindings.append((_ref(widget), item, sequence, funcid))
+        tips = self._registry.get(widget)
+        if tips == None:                                                        #   First ToolTip bound on this widget
+            tips = self._registry[widget] = {}
+            widget.bind("<Destroy>",
+                        lambda event, widget = _ref(widget): ToolTip._widget_destroyed(event, widget()),
+                        add = '+')
+        if self not in tips:                                                    #   Dict, constant time per ToolTip
+            tips[self] = None
+            if item != None and len(tips) >= 64 and len(tips) & (len(tips) - 1) == 0:
+                ToolTip.remove_items(widget)                                    #   Amortised, at every power of two
+
+    @classmethod
+    def remove_items(cls, canvas, items = None):
+        """ remove the ToolTips of canvas <items>, by default those of item ids no longer on <canvas>,
+            i.e. after the canvas has deleted and redrawn its items. Tags are only removed if given """
+        if items != None:
+            items = set(items)
+        for tip in list(cls._registry.get(canvas, ())):
+            item = tip.widget
+            if items != None:
+                if item in items:
+                    tip.remove()
+            elif type(item) == int and canvas.type(item) == None:              #   Item ids are never reused
+                tip.remove()
+
+    @classmethod
+    def _widget_destroyed(cls, event, widget):
+        """ a widget with ToolTips bound on it has been destroyed, remove them all """
+        if widget == None or event.widget is not widget:                        #   <Destroy> of a child widget
+            return
+        for tip in list(cls._registry.pop(widget, ())):
+            tip.remove()
+
+    @classmethod
+    def tooltips(cls, widget):
+        """ return the ToolTips bound on <widget>, for canvas items the canvas """
+        return list(cls._registry.get(widget, ()))
+
+    def unbind(self):
+        """ hide the ToolTip and unbind its handlers, other handlers of the widget are kept """
+        master = self._master()
+        if master != None:
+            HoverScheduler.get(master).forget(self)
+        self._cancel_text()
+        for widget, item, sequence, funcid in self.bindings:
+            widget = _deref(widget)
+            if widget == None:
+                continue
+            try:
+                _unbind(widget, sequence, funcid, item)
+            except tk.TclError:
+                _error("ToolTip could not be unbound")                          #   Widget already destroyed
+            tips = self._registry.get(widget)
+            if tips != None:
+                tips.pop(self, None)
+        self.bindings = []
+
+    def remove(self):
+        """ remove the ToolTip for good, it is no longer referenced by this module """
+        self.unbind()
+        for pending in list(self._pending.values()):
+            pending.pop(self, None)
+
+    @classmethod
+    def register(cls, entries, container = None):
+        """ create many ToolTips in one pass and return them as a list
+            <entries>    = iterable of (<widget>, <text>) or (<widget>, <text>, <options>),
+                           <options> is a dict of any other ToolTip keyword, i.e. window, canvas, time
+            <container>  = optional, widget containing all entries. Binding is deferred until the
+                           mouse first enters <container>, startup cost no longer depends on the
+                           number of ToolTips
+        """
+        tips = []
+        for entry in entries:
+            options = entry[2] if len(entry) > 2 else {}
+            tips.append(cls(entry[0], text = entry[1], bind = container == None, **options))
+        if container != None:
+            pending = cls._pending.get(container)
+            if pending == None:
+                pending = cls._pending[container] = {}
+                container.bind("<Enter>",                                       #   First time the mouse enters the container
+                               lambda event, container = container: cls._bind_pending(container),
+                               add = '+')
+            pending.update(dict.fromkeys(tips))
+        return tips
+
+    @classmethod
+    def _bind_pending(cls, container):
+        """ bind every ToolTip registered with <container> which is not bound yet """
+        pending = cls._pending.get(container)
+        if pending:
+            tips = list(pending)
+            pending.clear()
+            for tip in tips:
+                tip._bind()
 
 
 
@@ -120,11 +1590,22 @@ class ToolTip(object):
         """ return version info Major, Minor, Subversion """
         return VERSION_s
 
-    def config(self, text=None, time=None, font=None, fg=None, bg=None):
+    @staticmethod
+    def stats():
+        """ return the counters and timers of the library, empty while enable_stats() has not been called """
+        if _stats:
+            return _stats.snapshot()
+        return {}
+
+    def config(self, text=None, time=None, font=None, fg=None, bg=None, executor=None, placeholder=None, ttl=None,
+               style=None, maxwidth=None, maxlines=None, incanvas=None):
         """ configuration of ToolTip """
+        if style != None:
+            self.style = style if isinstance(style, ToolTipStyle) else ToolTipStyle.get(style)
         if text != None:
-            if type(text) != str:                                               #   String expected
-                raise TypeError("<text> must be a string")
+            if type(text) != str and not callable(text):                        #   String or callable expected
+                raise TypeError("<text> must be a string or a callable")
+            self._cancel_text()
             self.text = text                                                    #   Tooltip text
         if time != None:
             if type(time) != int:                                               #   Integer expected
@@ -138,313 +1619,845 @@ class ToolTip(object):
             self.fg = fg                                                        #   foreground color (textcolor)
         if bg != None:
             self.bg = bg                                                        #   background color
-
-
-
-
-
-    def tkinter_widget_enter(self, event=None):
-        """ Mouse Cursor has Entered Tkinter widget, display tooltip """
-        #self.widget.update()                                                    #
-        if debugging == True: print("*** Test ***")
-        #print("Info ", self.canvas.itemcget(self.widget, "SystemWindowFrame"))
-        #self.tw = tk.Toplevel(self.widget)                                      #   Create a toplevel widget
-
-        #if self.widget.winfo_exists():                                         # Prevents drawing on a widget that doesn't exist
-        if True:
-            parentName = self.widget.winfo_parent()
-            parent     = self.widget._nametowidget(parentName)                 # event.widget is your widget
-            frameParentName = parent.winfo_parent()
-            frameParent     = parent._nametowidget(frameParentName)            # parent is your widget
-        else:                                                                  # Exit if the widget doesn't exist (do I need to clean house at this point?)
+        if executor != None:
+            self.executor = executor                                            #   Computes callable text off the Tk thread
+        if placeholder != None:
+            if type(placeholder) != str:                                        #   String expected
+                raise TypeError("<placeholder> must be a string")
+            self.placeholder = placeholder                                      #   Shown while the text is computed
+        if ttl != None:
+            self.ttl = ttl                                                      #   Time to live of computed text
+        if maxwidth != None:
+            if type(maxwidth) != int or maxwidth <= 0:                          #   Positive integer expected
+                raise TypeError("<maxwidth> must be a positive integer")
+            self.maxwidth = maxwidth                                            #   Maximum width in pixels
+        if maxlines != None:
+            if type(maxlines) != int or maxlines <= 0:                          #   Positive integer expected
+                raise TypeError("<maxlines> must be a positive integer")
+            self.maxlines = maxlines                                            #   Maximum number of lines
+        if incanvas != None:
+            if incanvas == True and self.canvas == None:                        #   Items need a canvas
+                raise TypeError("<incanvas> requires a <canvas>")
+            self.incanvas = incanvas                                            #   Drawn as items on the canvas
+
+    def post(self, **changes):
+        """ thread-safe config(...), applied on the Tk thread by the UpdateQueue of the root """
+        UpdateQueue.of(self._master()).put(self, **changes)
+
+    def _master(self):
+        """ return the Tkinter widget the ToolTip belongs to """
+        return self.widget if self.window == None else self.window
+
+    def _display_text(self):
+        """ return the text to display, a callable <text> is computed or its computation started """
+        if type(self.text) == str:
+            return self.text
+        if self.result != None:                                                 #   Computed while waiting
+            text, self.result = self.result, None
+            return text
+        found, text = _text_cache.get(self.text)
+        if found:
+            return text
+        if _stats:
+            _stats.count("texts_computed")
+        if self.executor == None:                                               #   Compute on the Tk thread
+            text = _computed(self.text)
+            _text_cache.put(self.text, text, self.ttl)
+            return text
+        if self.future == None:
+            self.future = self.executor.submit(self.text)
+            self.poll = self._master().after(TEXT_POLL, self._poll_text)
+        return self.placeholder
+
+    def _poll_text(self):
+        """ check if <executor> has computed the text, show it in place if the ToolTip is still visible.
+            If the computation has raised, TEXT_FAILED replaces the placeholder """
+        if not self.future.done():
+            self.poll = self._master().after(TEXT_POLL, self._poll_text)
             return
-
-
-
-        self.tw = tk.Toplevel(parent)
-        self.tw.overrideredirect(True)                                          #   No frame for the widget
-        scr_w = self.widget.winfo_screenwidth()                                 #   Get screen resolution width
-        scr_h = self.widget.winfo_screenheight()                                #   Get screen resolution height
-        #x_ = self.tw.winfo_pointerx()                                           #   Pointer X-position, not used for anything here
-        #y_ = self.tw.winfo_pointery()                                           #   Pointer Y-position, not used for anything here
+        future, self.future, self.poll = self.future, None, None
+        text = _computed(future.result)
+        _text_cache.put(self.text, text, self.ttl)
+        self.result = text
+        HoverScheduler.get(self._master()).refresh(self)
+
+    def _cancel_text(self):
+        """ cancel the computation of the text, the mouse has left before it was done """
+        if self.future != None:
+            self.future.cancel()
+            self.future = None
+        if self.poll != None:
+            self._master().after_cancel(self.poll)
+            self.poll = None
+        self.result = None
+
+
+
+
+
+    def _acquire_window(self):
+        """ take a withdrawn window from the pool, or keep the one handed over.
+            With <incanvas> the item pair of the canvas is used instead """
+        items = isinstance(self.tw, CanvasTipItems)
+        if self.tw != None and (items != (self.incanvas == True) or items and self.tw.canvas is not self.canvas):
+            self._release_window()                                              #   Handed over by another kind of ToolTip
+        if self.tw == None:
+            if self.incanvas == True:
+                self.tw = CanvasTipItems.get(self.canvas)
+            else:
+                self.tw = ToolTipPool.get(self._master()).acquire()
+
+    def _tooltip_layout(self, text):
+        """ return (text, width, height) of the ToolTip window from cached font metrics, no update() needed.
+            Large texts are wrapped and truncated """
+        font = self.font
+        _font(self._master(), font)
+        if self.maxwidth == None and self.maxlines == None and len(text) <= LARGE_TEXT:
+            return (text,) + _measure(text, font, LABEL_PADDING)
+        return _layout(text, font, self.maxwidth or LARGE_WIDTH, self.maxlines or LARGE_LINES, LABEL_PADDING)
+
+    def _map_window(self, text, x, y, width, height):
+        """ configure the label of the withdrawn ToolTip window, place it at <x>, <y>, show it and start its
+            auto-hide timer in a single call of the ::tkinter_tooltip procs, return False on error. The canvas
+            item pair is drawn at canvas coordinates <x>, <y> with <width> x <height> instead """
         try:
-            self.tooltiplabel = tk.Label(self.tw,                               #   Label in the widget
-                     text = self.text,                                          #   Text to show
-                     foreground = self.fg,                                      #   define foregroundcolor
-                     background = self.bg,                                      #   define backgroundcolor
-                     relief = 'ridge',                                          #   Display Style
-                     borderwidth = 1,                                           #   1 Pixel Border
-                     font = self.font).pack(ipadx=5)                            #   Define Font
+            scheduler = HoverScheduler.get(self._master())
+            font = self.style.named_font(self._master()) if self._font == None else self._font
+            if isinstance(self.tw, CanvasTipItems):
+                self.tw.configure(text = text, fg = self.fg, bg = self.bg, font = font)
+                timer = self.tw.place(x, y, width, height, scheduler.time, scheduler.command)
+            else:
+                timer = _tcl(self.tw).call("::tkinter_tooltip::show", self.tw._w, text, self.fg, self.bg, font,
+                                           int(x), int(y), scheduler.time, scheduler.command)
+            scheduler.hiding = str(timer) or None
         except tk.TclError:
-            traceback.print_exc(limit=2, file=sys.stdout)                       #   print Traceback
-            if debugging == True: print("Error has occured")
-            if "tw" in self.__dict__.keys() :                                   #   Only attempt to destroy if it exists
-                self.tw.destroy()                                               #   close tooltip
-                del self.tw                                                     #   Remove "tw" to prevent errors with <leave> method
-                if debugging == True: print(self.__dict__.keys())
-                return
+            log.warning("ToolTip could not be shown", exc_info = True)
+            if _stats:
+                _stats.count("tcl_errors")
+            self._release_window()
+            return False
+        if _stats:
+            _stats.count("shown")
+        return True
+
+    def _release_window(self, hidden = False):
+        """ return the ToolTip window to the pool, or hide the canvas items, <hidden> if they are already """
+        if isinstance(self.tw, CanvasTipItems):
+            self.tw.release(hidden)
         else:
-            self.tw.update()                                                    #   Display ToolTip
+            pool = ToolTipPool._pools.get(self.tw._root())                      #   Never build a new pool while hiding
+            if pool != None:
+                pool.release(self.tw, hidden)                                   #   Withdraw ToolTip
+            else:
+                try:
+                    self.tw.destroy()                                           #   Its pool has been destroyed
+                except tk.TclError:
+                    _error("ToolTip window already gone")
+        self.tw = None                                                          #   Reset "tw" to prevent errors with <leave> method
+
+    def _hide_idle(self, command):
+        """ hide the window, or the canvas items, once Tk is idle and call Tcl <command> after, return the timer id """
+        if isinstance(self.tw, CanvasTipItems):
+            canvas = self.tw.canvas
+            return str(_tcl(canvas).call("::tkinter_tooltip::leave", canvas._w, self.tw.tag, command))
+        return str(_tcl(self.tw).call("::tkinter_tooltip::leave", self.tw._w, "", command))
+
+    def _placement_failed(self):
+        """ the ToolTip could not be laid out or placed, give back the window it may hold """
+        _error("ToolTip %r could not be placed", self.widget)
+        if self.tw != None:                                                     #   A handed over window is still mapped
             try:
-                w_posy = self.widget.winfo_rooty()                              #   Get widget Y Position (Top)
-                w_posx = self.widget.winfo_rootx()                              #   Get widget X Position (left)
-                if debugging == True: print(" X: ", w_posx, " Y: ", w_posy)
-                w_height = self.widget.winfo_height()                           #   Get widget height
-                w_width = self.widget.winfo_width()                             #   Get widget width
-                t_height = self.tw.winfo_height()                               #   Get ToolTip heigth
-                t_width = self.tw.winfo_width()                                 #   Get ToolTip width
-                if t_height + self.widget.winfo_rooty() + 50 > scr_h:           #   Check if ToolTip is out of screen bottom
-                    y = w_posy - t_height                                       #   Position it above widget
-                else:
-                    y = w_posy + w_height                                       #   Position it below widget
-                if t_width + self.widget.winfo_rootx() + w_width + 5 > scr_w:   #   Check if ToolTip is out of screen right
-                    x = w_posx - t_width - 5                                    #   Position it on the left
+                self._release_window()
+            except tk.TclError:
+                self.tw = None
+                _error("ToolTip could not be hidden")
+
+    def follow_motion(self, event):
+        """ Mouse Cursor has moved while following, move the tooltip at the next frame """
+        if self.tw == None:                                                     #   Not shown, nothing to move
+            return
+        self.motion = event                                                     #   Earlier motion is dropped
+        if self.frame == None:
+            self.frame = self._master().after(max(1, 1000 // self.followrate), self._follow_frame)
+
+    def _follow_frame(self):
+        """ move the shown tooltip to the last cursor position, change its text if <followtext> is given """
+        self.frame = None
+        event, self.motion = self.motion, None
+        if self.tw == None or event == None:
+            return
+        start = _stats and time.perf_counter()
+        try:
+            items = isinstance(self.tw, CanvasTipItems)
+            if self.followtext != None:
+                text, t_width, t_height = self._tooltip_layout(str(self.followtext(event)))
+                if items:
+                    self.tw.configure(text = text)                              #   Same items, new text
                 else:
-                    x = w_posx + w_width + 5                                    #   Position it on the right
-                self.tw.wm_geometry("+%d+%d" % (x, y))                          #   Set ToolTip Position
-            except :
-                pass                                                            #   if bad window path nothing happens
-            if self.time > 0:
-                if "tw" in self.__dict__.keys() :
-                    self.catch = self.tw.after(self.time, self.tkinter_widget_leave)                          #   Start timer
+                    self.tw.children['tooltiplabel'].configure(text = text)     #   Same window, new text
+            elif items:
+                text, t_width, t_height = self._tooltip_layout(self.tw.text)
+            else:
+                text, t_width, t_height = self._tooltip_layout(self.tw.children['tooltiplabel'].cget('text'))
+            if items:                                                           #   Canvas coordinates, no screen query
+                positionX, positionY = self._canvas_position(event, None, t_width, t_height)
+                self.tw.place(positionX, positionY, t_width, t_height)
+                return
+            scr_w, scr_h = GeometryCache.get(self._master()).screen()           #   Get screen resolution
+            positionX = event.x_root + 10                                       #   10 pixels Right of Cursor
+            positionY = event.y_root + 10                                       #   10 pixels Down of Cursor
+            if (positionX + t_width) > scr_w:                                   #   Too Close to edge of Screen in X-Axis?
+                positionX = positionX - t_width - 20                            #   Move over to the Left of the Cursor Instead
+            if (positionY + t_height) > scr_h:                                  #   Too Close to Edge of Screen in Y-Axis?
+                positionY = positionY - t_height - 20                           #   Move over to above the Cursor Instead
+            self.tw.wm_geometry("+%d+%d" % (positionX, positionY))              #   Move ToolTip
+        except tk.TclError:
+            _error("ToolTip %r could not follow the cursor", self.widget)
+        finally:
+            if _stats and start:
+                _stats.time("follow", time.perf_counter() - start)
+
+    def _cancel_follow(self):
+        """ stop following the cursor, the tooltip is hidden """
+        if self.frame != None:
+            self._master().after_cancel(self.frame)
+            self.frame = None
+        self.motion = None
+
+    def tkinter_widget_enter(self, event=None):
+        """ Mouse Cursor has Entered Tkinter widget, display tooltip once the show delay has passed """
+        HoverScheduler.get(self.widget).enter(self, self._show_widget, event)
 
     def tkinter_widget_leave(self, event=None):
         """ Mouse Cursor has Left Tkinter widget, Remove tooltip """
-        try:
-            if "tw" in self.__dict__.keys() :                                       #   Check if Already Destroyed
-                if "catch" in self.__dict__.keys():                                 #   Destroy scheduled for the future?
-                    self.tw.after_cancel(self.catch)                                #   Cancel future destroy if already doing destroy
-                if debugging == True: print("about to destroy")                     #   Sanity check, check it exists before destroy
-                if "tw" in self.__dict__.keys():                                    #   Sanity check, check it exists before destroy
-                    self.tw.destroy()                                               #   Destroy ToolTip
-                    if debugging == True: print(self.__dict__.keys())
-                    del self.tw                                                     #   Delete handler from List
-                    if debugging == True: print(self.__dict__.keys())
-        except:
-            pass
-
-
-
-    def canvas_widget_enter(self, event = None):
-        """ Mouse Cursor has Entered Canvas widget, display tooltip """
-        self.tw = tk.Toplevel(self.window)                                              #   Create a toplevel widget, would it be more efficient as a separate thread or process?
-        self.tw.overrideredirect(True)                                                  #   No frame for the widget
-        scr_w = self.window.winfo_screenwidth()                                         #   Get screen resolution width
-        scr_h = self.window.winfo_screenheight()                                        #   Get screen resolution height
-        if debugging == True: print("Screen width: ", scr_w)
-        if debugging == True: print("Screen Height: ", scr_h)
-        mouse_posx = self.tw.winfo_pointerx()                                            #   Mouse Cursor X-position
-        mouse_posy = self.tw.winfo_pointery()                                            #   Mouse Cursor Y-position
-        if debugging == True: print("Pointer X", mouse_posx, "Pointer Y", mouse_posy)
+        HoverScheduler.get(self.widget).leave(self)
 
+    def _show_widget(self, event=None):
+        """ display the tooltip next to the Tkinter widget, return False on error """
+        cache = GeometryCache.get(self.widget)
+        start = _stats and time.perf_counter()
+        shown = False
         try:
-            self.tooltiplabel = tk.Label(self.tw,                                       #   Label in the widget
-                     text = self.text,                                                  #   Text to show
-                     foreground = self.fg,                                              #   define foregroundcolor
-                     background = self.bg,                                              #   define backgroundcolor
-                     relief = 'ridge',                                                  #   Display Style
-                     borderwidth = 1,                                                   #   1 Pixel Border
-                     font = self.font).pack(ipadx=5)                                    #   Define Font
+            text, t_width, t_height = self._tooltip_layout(self._display_text()) #   Get ToolTip text and size, font may be bad
+            self._acquire_window()
+            scr_w, scr_h = cache.screen()                                       #   Get screen resolution
+            w_posx, w_posy, w_width, w_height = cache.geometry(self.widget)     #   Get widget position and size
+            if t_height + w_posy + 50 > scr_h:                                  #   Check if ToolTip is out of screen bottom
+                y = w_posy - t_height                                           #   Position it above widget
+            else:
+                y = w_posy + w_height                                           #   Position it below widget
+            if t_width + w_posx + w_width + 5 > scr_w:                          #   Check if ToolTip is out of screen right
+                x = w_posx - t_width - 5                                        #   Position it on the left
+            else:
+                x = w_posx + w_width + 5                                        #   Position it on the right
+            shown = self._map_window(text, x, y, t_width, t_height)
         except tk.TclError:
-            if debugging == True: print("Error has occured")
-            if debugging == True: print(self.__dict__.keys())
-            traceback.print_exc(limit=2, file=sys.stdout)                               #   print Traceback
-            if "tw" in self.__dict__.keys() :                                           #   Check if it exists before tryin to destroy (actually needed or not?)
-                if debugging == True: print("about to destroy")
-                self.tw.destroy()                                                       #   Close ToolTip if label creation error
-                del self.tw                                                             #   Delete Handler from List
-                return
-        else:
-            self.tw.update()                                                            #   Display ToolTip
-            try:
-                t_height = self.tw.winfo_height()                                       #   Get ToolTip Window heigth
-                t_width = self.tw.winfo_width()                                         #   Get ToolTip Window width
-
-                if debugging == True: print("ToolTip Window Height: ", t_height)
-                if debugging == True: print("ToolTip Window Width: ", t_width)
-
-                positionX = mouse_posx + 10                                             #   10 pixels Right of Cursor
-                positionY = mouse_posy + 10                                             #   10 pixels Down of Cursor
+            self._placement_failed()                                            #   if bad window path nothing happens
+        if _stats and start:
+            _stats.time("placement", time.perf_counter() - start)
+        return shown
 
-                if debugging == True: print("positionX", positionX)
-                if debugging == True: print("positionY", positionY)
 
-                if (positionX + t_width) > scr_w:                                       #   Too Close to edge of Screen in X-Axis?
-                    positionX = positionX - t_width                                     #   Move over to the Left of the Cursor Instead
-                if (positionY + t_height) > scr_h:                                      #   Too Close to Edge of Screen in Y-Axis?
-                    positionY = positionY - t_height                                    #   Move over to above the Cursor Instead
-
-                if debugging == True: print("positionX", positionX)
-                if debugging == True: print("positionY", positionY)
-
-                self.tw.wm_geometry("+%d+%d" % (positionX, positionY))                  #   Set ToolTip Position
-                self.canvas.update()                                                    #   Is this actually needed?
-            except :
-                pass                                                                    #   if bad window path nothing happens
-            if self.time > 0:
-                if "tw" in self.__dict__.keys() :
-                    self.catch = self.tw.after(self.time, self.canvas_widget_leave)     #   Start timer print()
 
+    def canvas_widget_enter(self, event = None):
+        """ Mouse Cursor has Entered Canvas widget, display tooltip once the show delay has passed """
+        HoverScheduler.get(self.window).enter(self, self._show_canvas, event)
 
     def canvas_widget_leave(self, event = None):
         """ Mouse Cursor has Left Canvas widget, Remove tooltip """
+        HoverScheduler.get(self.window).leave(self)
+
+    def cursor_enter(self, event = None):
+        """ display the tooltip next to the mouse cursor once the show delay has passed, used by the
+            delegated handlers of DelegatedToolTip for canvases and plain widgets alike """
+        HoverScheduler.get(self._master()).enter(self, self._show_canvas, event)
+
+    def cursor_leave(self, event = None):
+        """ Remove the tooltip shown by cursor_enter() """
+        HoverScheduler.get(self._master()).leave(self)
+
+    def _show_canvas(self, event = None):
+        """ display the tooltip next to the mouse cursor, return False on error """
+        if self.incanvas == True:
+            return self._show_in_canvas(event, None)
+        start = _stats and time.perf_counter()
+        shown = False
         try:
-            if "tw" in self.__dict__.keys() :                                           #   Check if Already Destroyed
-                if "catch" in self.__dict__.keys():                                     #   Destroy scheduled for the future?
-                    self.tw.after_cancel(self.catch)                                    #   Cancel future destroy if already doing destroy
-                if "tw" in self.__dict__.keys() :                                       #   Sanity check, check it exists before destroy
-                    if debugging == True: print("about to destroy")
-                    self.tw.destroy()                                                   #   Destroy ToolTip
-                    if debugging == True: print(self.__dict__.keys())
-                    del self.tw                                                         #   Delete handler from List
-                    if debugging == True: print(self.__dict__.keys())
-        except:
-            pass
-
-
+            text, t_width, t_height = self._tooltip_layout(self._display_text()) #   Get ToolTip text and size, font may be bad
+            self._acquire_window()
+            scr_w, scr_h = GeometryCache.get(self.window).screen()                      #   Get screen resolution
+            if event != None:
+                mouse_posx, mouse_posy = event.x_root, event.y_root                     #   Mouse Cursor position, sent with the event
+            else:
+                mouse_posx = self.window.winfo_pointerx()                               #   Mouse Cursor X-position
+                mouse_posy = self.window.winfo_pointery()                               #   Mouse Cursor Y-position
 
+            positionX = mouse_posx + 10                                                 #   10 pixels Right of Cursor
+            positionY = mouse_posy + 10                                                 #   10 pixels Down of Cursor
 
 
+            if (positionX + t_width) > scr_w:                                           #   Too Close to edge of Screen in X-Axis?
+                positionX = positionX - t_width                                         #   Move over to the Left of the Cursor Instead
+            if (positionY + t_height) > scr_h:                                          #   Too Close to Edge of Screen in Y-Axis?
+                positionY = positionY - t_height                                        #   Move over to above the Cursor Instead
 
-    def canvas_widget_scroll_enter(self, event = None):
-        """ Mouse Cursor has Entered a Canvas Widget, where the canvas has X and Y scrollbars, display tooltip """
-        if debugging == True: print("**** canvas_widget_scroll_enter ***")
-        if debugging == True: print("Contents: ", self.__dict__.keys())
-        self.tw = tk.Toplevel(self.window)                                          #   Create a toplevel widget, more efficient as parallel process or thread?
-        if debugging == True: print("Contents: ", self.__dict__.keys())
-        self.tw.overrideredirect(True)                                              #   No frame for the widget
-        scr_w = self.window.winfo_screenwidth()                                     #   Get screen resolution width
-        scr_h = self.window.winfo_screenheight()                                    #   Get screen resolution height
-        if debugging == True: print("Screen width: ", scr_w)
-        if debugging == True: print("Screen Height: ", scr_h)
 
-        try:
-            if "tw" in self.__dict__.keys() :
-                if debugging == True: print("Make Label")
-                self.tooltiplabel = tk.Label(self.tw,                                   #   Label in the widget
-                                             text = self.text,                          #   Text to show
-                                             foreground = self.fg,                      #   define foregroundcolor
-                                             background = self.bg,                      #   define backgroundcolor
-                                             relief = 'ridge',                          #   Display Style
-                                             borderwidth = 1,                           #   1 Pixel Border
-                                             font = self.font).pack(ipadx=5)            #   Define Font
+            shown = self._map_window(text, positionX, positionY, t_width, t_height)
         except tk.TclError:
-            if debugging == True: print("tk.TclError")
-            traceback.print_exc(limit=2,file=sys.stdout)                                #   print Traceback
-            print("Error has occured")
-            print(self.__dict__.keys())
-
-            if "tw" in self.__dict__.keys() :
-                if debugging == True: print("about to destroy")
-                self.tw.destroy()                                                       #   Close ToolTip if label creation error
-                del self.tw                                                             #   Delete Handler from List
-                return
-
-        else:
-            self.tw.update()                                                            #   Display ToolTip
-            try:
-                coordinates = self.canvas.bbox(self.widget)
-                if debugging == True: print("Widget Coordinates: ", coordinates)
-                                                                                #   Widget Absolute Coordinates in Canvas
-                w_posx = coordinates[0]                                         #   Absolute Widget in Canvas X position, top left corne
-                w_posy = coordinates[1]                                         #   Absolute Widget in Canvas Y position, top left corner
+            self._placement_failed()                                                    #   if bad window path nothing happens
+        if _stats and start:
+            _stats.time("placement", time.perf_counter() - start)
+        return shown
 
-                if debugging == True: print("Absolute Widget X: ", w_posx)
-                if debugging == True: print("Absolute Widget Y: ", w_posy)
 
-                if debugging == True: print(self.scrollbarX.get()[0] * self.scrollregionX)
 
 
 
 
-                w_posx = w_posx - self.scrollbarX.get()[0] * self.scrollregionX   #   Convert Absolute X to Relative X Position
-                w_posy = w_posy - self.scrollbarY.get()[0] * self.scrollregionY   #   Convert Absolute Y to Relative Y Position
+    def canvas_widget_scroll_enter(self, event = None):
+        """ Mouse Cursor has Entered a Canvas Widget, where the canvas has X and Y scrollbars, display tooltip
+            once the show delay has passed """
+        HoverScheduler.get(self.window).enter(self, self._show_canvas_scroll, event)
 
-                if debugging == True: print("Relative Widget X: ", w_posx)
-                if debugging == True: print("Relative Widget Y: ", w_posy)
+    def canvas_widget_scroll_leave(self, event = None):
+        """ Mouse Cursor has Left a Canvas Widget, where the canvas has X and Y scrollbars, Remove tooltip """
+        HoverScheduler.get(self.window).leave(self)
+
+    def _show_canvas_scroll(self, event = None):
+        """ display the tooltip next to the canvas item, return False on error """
+        if self.incanvas == True:
+            return self._show_in_canvas(event, self.widget)
+        cache = GeometryCache.get(self.window)
+        start = _stats and time.perf_counter()
+        shown = False
+        try:
+            text, t_width, t_height = self._tooltip_layout(self._display_text()) #   Get ToolTip text and size, font may be bad
+            self._acquire_window()
+            scr_w, scr_h = cache.screen()                                       #   Get screen resolution
+            coordinates = self.canvas.bbox(self.widget)
+                                                                            #   Widget Absolute Coordinates in Canvas
+            w_posx = coordinates[0]                                         #   Absolute Widget in Canvas X position, top left corne
+            w_posy = coordinates[1]                                         #   Absolute Widget in Canvas Y position, top left corner
 
-                                                                                #   Window Top Left Corner Absolute Pos in Screen
-                window_y = self.window.winfo_rooty()                            #   Window Top Left X coordinate
-                window_x = self.window.winfo_rootx()                            #   Window Top Right Y Coordinate
 
-                if debugging == True: print("Window Absolute X: ", window_x)
-                if debugging == True: print("Window Absolute Y: ", window_y)
+            view_x, view_y = cache.view(self.canvas, self.scrollbarX, self.scrollbarY)
+            w_posx = w_posx - view_x * self.scrollregionX                   #   Convert Absolute X to Relative X Position
+            w_posy = w_posy - view_y * self.scrollregionY                   #   Convert Absolute Y to Relative Y Position
 
-                canvas_x = self.canvas.winfo_rootx()                            #   Absolute Canvas position X in screen, Top Left Corner
-                canvas_y = self.canvas.winfo_rooty()                            #   Absolute Canvas position Y in screen, Top Left Corner
 
-                if debugging == True: print("Canvas Absolute X position in Screen: ", canvas_x)
-                if debugging == True: print("Canvas Absolute Y position in Screen: ", canvas_y)
+            canvas_x, canvas_y = cache.geometry(self.canvas)[:2]            #   Absolute Canvas position in screen, Top Left Corner
 
-                w_height = coordinates[3] - coordinates[1]                           #   Widget Height (in pixels)
-                w_width = coordinates[2] - coordinates[0]                            #   Widget Width (in pixels)
 
+            w_height = coordinates[3] - coordinates[1]                           #   Widget Height (in pixels)
+            w_width = coordinates[2] - coordinates[0]                            #   Widget Width (in pixels)
 
-                t_height = self.tw.winfo_height()                                    #   Get ToolTip heigth
-                t_width = self.tw.winfo_width()                                      #   Get ToolTip width
 
-                positionX =  w_posx + canvas_x + w_width                             #   ToolTip left corner X Position
-                positionY =  w_posy + canvas_y + w_height                            #   ToolTip Left Corner Y Position
+            positionX =  w_posx + canvas_x + w_width                             #   ToolTip left corner X Position
+            positionY =  w_posy + canvas_y + w_height                            #   ToolTip Left Corner Y Position
 
-                if debugging == True: print("Proposed Tooltip position X: ", positionX)
-                if debugging == True: print("Proposed Tooltip position Y: ", positionY)
 
-                if ((positionX + t_width + 50) > scr_w):                             #   Check if ToolTip is out of Screen on Right
-                    positionX = canvas_x + w_posx - t_width - 5                      #   If too far right, put on left side
-                if ((positionY + t_height + 50) > scr_h):                            #   Check if ToolTip is out of Screen on Bottom
-                    positionY = canvas_y + w_posy - t_height - 5                     #   If too far down, put above
+            if ((positionX + t_width + 50) > scr_w):                             #   Check if ToolTip is out of Screen on Right
+                positionX = canvas_x + w_posx - t_width - 5                      #   If too far right, put on left side
+            if ((positionY + t_height + 50) > scr_h):                            #   Check if ToolTip is out of Screen on Bottom
+                positionY = canvas_y + w_posy - t_height - 5                     #   If too far down, put above
 
-                if debugging == True: print("Corrected Tooltip Position X", positionX)
-                if debugging == True: print("Corrected Tooltip Position Y", positionY)
 
-                self.tw.wm_geometry("+%d+%d" % (positionX, positionY))               #   Set ToolTip Position
-                self.canvas.update()
-            except :
-                pass                                                                 #   if bad window path nothing happens
-            if self.time > 0:
-                if "tw" in self.__dict__.keys() :
-                    self.catch = self.tw.after(self.time, self.canvas_widget_scroll_leave)       #   Start timer print()
+            shown = self._map_window(text, positionX, positionY, t_width, t_height)
+        except (tk.TclError, TypeError):                                         #   TypeError, bbox of a deleted item
+            self._placement_failed()                                             #   if bad window path nothing happens
+        if _stats and start:
+            _stats.time("placement", time.perf_counter() - start)
+        return shown
 
-    def canvas_widget_scroll_leave(self, event = None):
-        """ Mouse Cursor has Left a Canvas Widget, where the canvas has X and Y scrollbars, Remove tooltip """
+    def _canvas_position(self, event, item, t_width, t_height):
+        """ return the canvas coordinates of a <t_width> x <t_height> tooltip drawn on the canvas, below
+            right of the cursor or of canvas <item>, moved to the other side at the edge of the view """
+        canvas = self.canvas
+        canvas_x, canvas_y, canvas_w, canvas_h = GeometryCache.get(canvas).geometry(canvas)
+        left, top = canvas.canvasx(0), canvas.canvasy(0)                        #   Visible area in canvas coordinates
+        if item != None:
+            x1, y1, x2, y2 = canvas.bbox(item)                                  #   Canvas coordinates, no scroll math
+        else:
+            if event != None:
+                mouse_x, mouse_y = event.x, event.y                             #   Relative to the canvas
+            else:
+                mouse_x = canvas.winfo_pointerx() - canvas_x
+                mouse_y = canvas.winfo_pointery() - canvas_y
+            x1, y1 = left + mouse_x - 10, top + mouse_y - 10                    #   10 pixels around the cursor
+            x2, y2 = left + mouse_x + 10, top + mouse_y + 10
+        positionX, positionY = x2, y2
+        if positionX + t_width > left + canvas_w:                               #   Out of the view on the right
+            positionX = x1 - t_width                                            #   Put on left side
+        if positionY + t_height > top + canvas_h:                               #   Out of the view at the bottom
+            positionY = y1 - t_height                                           #   Put above
+        return positionX, positionY
+
+    def _show_in_canvas(self, event, item):
+        """ display the tooltip as canvas items next to the cursor, or next to canvas <item>,
+            return False on error """
+        start = _stats and time.perf_counter()
+        shown = False
         try:
-            if "tw" in self.__dict__.keys() :                                       #   Check if Already Destroyed
-                if "catch" in self.__dict__.keys():                                 #   Destroy scheduled for the future?
-                    self.tw.after_cancel(self.catch)                                #   Cancel future destroy if already doing destroy
-                if debugging == True: print("about to destroy")                     #   Sanity check, check it exists before destroy
-                if "tw" in self.__dict__.keys():                                    #   Sanity check, check it exists before destroy
-                    self.tw.destroy()                                               #   Destroy ToolTip
-                    if debugging == True: print(self.__dict__.keys())
-                    del self.tw                                                     #   Delete handler from List
-                    if debugging == True: print(self.__dict__.keys())
-        except:
-            pass
-
-    def onClick(self, event):
-        if debugging == True: print("Click Relative Coordinates in canvas: ", event.x, event.y)
-        if debugging == True: print("Click Absolute Coordinates in canvas", self.window.winfo_pointerx(), self.window.winfo_pointery())
-        if debugging == True: print("testjkjlk")
-
-
-
-
-
-
-
+            text, t_width, t_height = self._tooltip_layout(self._display_text()) #   Get ToolTip text and size, font may be bad
+            self._acquire_window()
+            positionX, positionY = self._canvas_position(event, item, t_width, t_height)
+            shown = self._map_window(text, positionX, positionY, t_width, t_height)  #   No window mapped
+        except (tk.TclError, TypeError):                                         #   TypeError, bbox of a deleted item
+            self._placement_failed()
+        if _stats and start:
+            _stats.time("placement", time.perf_counter() - start)
+        return shown
+
+
+
+class DelegatedToolTip(object):
+    """ Base of the classes showing the ToolTips of many keys (canvas items, rows, cells) with one
+        delegated <Motion> handler and one shared ToolTip
+        Subclasses resolve the key under the cursor and call _hover(<key>, <event>), text(<key>)
+        returns the text of a key, None for no ToolTip. Moving to another key swaps the content of
+        the visible window.
+    """
 
+    def __init__(self, window, canvas = None, **options):
+        """ DelegatedToolTip initialisation, window is mandatory """
+        self.current = None                                                     #   Key the cursor is over
+        self.tip = ToolTip(None, window, canvas, bind = False, **options)       #   Shared display for all keys
 
+    def text(self, key):
+        """ return the text of <key>, None for none, overridden by the subclasses """
+        return None
 
+    def _hover(self, key, event):
+        """ the cursor is over <key>, None for nothing, show its ToolTip """
+        if key == self.current:                                                 #   Still over the same key
+            if key != None and self.tip.follow == True:
+                self.tip.follow_motion(event)
+            return
+        text = None if key == None else self.text(key)
+        if text == None:
+            self._hide()
+            self.current = key                                                  #   No lookup until the key changes
+        else:                                                                   #   Content swapped in the visible window
+            self.current = key
+            self.tip.config(text = text)
+            self.tip.cursor_enter(event)
+
+    def _hide(self):
+        """ hide the ToolTip currently shown """
+        self.current = None
+        self.tip.cursor_leave()
+
+
+
+class CanvasToolTip(DelegatedToolTip):
+    """ Class creating tooltips for many items of one canvas with a single <Motion> handler
+        Usage: tips = CanvasToolTip(<canvas>, <window>, <cellsize>, <options>)
+               tips.add(<item>, <text>)
+        <canvas>    = required, tk.Canvas holding the items
+        <window>    = required, window containing the canvas
+        <cellsize>  = optional, size in pixels of one cell of the spatial grid, default 64
+        <options>   = any other ToolTip keyword, i.e. time, font, fg, bg
+
+        The item under the cursor is resolved through a uniform grid over the item bboxes, one
+        canvas tag binding per item is no longer needed. Items must be given by id. When items
+        overlap, the one added (or refreshed) last wins. Keep the grid up to date by changing
+        items through move(), coords() and delete(), or call refresh() after changing them directly.
+        Items covering more than <maxcells> cells (a background, a huge zoom) are kept out of the
+        grid and checked one by one instead.
+    """
 
+    maxcells = 256                                                              #   Larger items are not put into the grid
 
+    def __init__(self, canvas, window, cellsize = 64, **options):
+        """ CanvasToolTip initialisation, canvas and window are mandatory """
+        if type(cellsize) != int or cellsize <= 0:                              #   Positive integer expected
+            raise TypeError("<cellsize> must be a positive integer")
+        self.canvas = canvas
+        self.window = window
+        self.cellsize = cellsize
+        self.texts = {}                                                         #   item -> text
+        self.bboxes = {}                                                        #   item -> (x1, y1, x2, y2) in canvas coordinates
+        self.order = {}                                                         #   item -> stacking order, last added on top
+        self.grid = {}                                                          #   (column, row) -> set of items
+        self.large = set()                                                      #   Items covering more than maxcells cells
+        self.counter = 0
+        DelegatedToolTip.__init__(self, window, canvas, **options)
+
+        self.canvas.bind("<Motion>", self.canvas_motion, add = '+')             #   Single handler for every item
+        self.canvas.bind("<Leave>", self.canvas_leave, add = '+')
+
+    def _span(self, bbox):
+        """ return the first and last column and row of the grid cells covered by <bbox> """
+        size = self.cellsize
+        return tuple(int(math.floor(value / size)) for value in bbox)
+
+    def _cells(self, bbox):
+        """ return the grid cells covered by <bbox> """
+        x1, y1, x2, y2 = self._span(bbox)
+        return [(column, row) for column in range(x1, x2 + 1) for row in range(y1, y2 + 1)]
+
+    def _index(self, item, bbox):
+        """ (re)insert <item> with <bbox> into the grid """
+        self._unindex(item)
+        if bbox == None:                                                        #   Item has no visible area
+            return
+        self.bboxes[item] = bbox
+        self.counter += 1
+        self.order[item] = self.counter
+        x1, y1, x2, y2 = self._span(bbox)
+        if (x2 - x1 + 1) * (y2 - y1 + 1) > self.maxcells:                       #   Too many cells, checked one by one
+            self.large.add(item)
+            return
+        for cell in self._cells(bbox):
+            self.grid.setdefault(cell, set()).add(item)
+
+    def _unindex(self, item):
+        """ remove <item> from the grid """
+        bbox = self.bboxes.pop(item, None)
+        self.order.pop(item, None)
+        if bbox == None:
+            return
+        if item in self.large:
+            self.large.discard(item)
+            return
+        for cell in self._cells(bbox):
+            items = self.grid.get(cell)
+            if items != None:
+                items.discard(item)
+                if len(items) == 0:
+                    del self.grid[cell]
+
+    def add(self, item, text):
+        """ add a ToolTip with <text> to canvas <item>, <text> may be a callable as for ToolTip """
+        if type(text) != str and not callable(text):                            #   String or callable expected
+            raise TypeError("<text> must be a string or a callable")
+        self.texts[item] = text
+        self._index(item, self.canvas.bbox(item))
+
+    def config(self, item, text):
+        """ change the text of the ToolTip of <item> """
+        if type(text) != str and not callable(text):                            #   String or callable expected
+            raise TypeError("<text> must be a string or a callable")
+        self.texts[item] = text
+        if item == self.current:
+            self.tip.config(text = text)
+            HoverScheduler.get(self.window).refresh(self.tip)
+
+    def post(self, item, text):
+        """ thread-safe config(<item>, <text>), applied on the Tk thread by the UpdateQueue of the root """
+        UpdateQueue.of(self.window).put(self, item, text = text)
+
+    def remove(self, item):
+        """ remove the ToolTip of <item>, the canvas item itself is kept """
+        self.texts.pop(item, None)
+        self._unindex(item)
+        if item == self.current:
+            self._hide()
+
+    def refresh(self, item):
+        """ re-read the bbox of <item> after it has been changed on the canvas directly """
+        if item in self.texts:
+            self._index(item, self.canvas.bbox(item))
+
+    def move(self, item, dx, dy):
+        """ move <item> on the canvas and update the grid without querying the canvas """
+        self.canvas.move(item, dx, dy)
+        bbox = self.bboxes.get(item)
+        if bbox != None:
+            self._index(item, (bbox[0] + dx, bbox[1] + dy, bbox[2] + dx, bbox[3] + dy))
+
+    def coords(self, item, *coords):
+        """ change the coordinates of <item> on the canvas and update the grid """
+        self.canvas.coords(item, *coords)
+        self.refresh(item)
+
+    def delete(self, item):
+        """ delete <item> from the canvas together with its ToolTip """
+        self.remove(item)
+        self.canvas.delete(item)
+
+    def find(self, x, y):
+        """ return the topmost item with a ToolTip at canvas coordinates <x>, <y>, or None """
+        items = self.grid.get((int(math.floor(x / self.cellsize)), int(math.floor(y / self.cellsize))))
+        found = None
+        for candidates in (items or (), self.large):
+            for item in candidates:
+                x1, y1, x2, y2 = self.bboxes[item]
+                if x1 <= x <= x2 and y1 <= y <= y2:
+                    if found == None or self.order[item] > self.order[found]:
+                        found = item
+        return found
+
+    def text(self, item):
+        """ return the text of <item>, None for none """
+        return self.texts.get(item)
+
+    def canvas_motion(self, event):
+        """ Mouse Cursor has moved over the canvas, show the ToolTip of the item under it """
+        self._hover(self.find(self.canvas.canvasx(event.x), self.canvas.canvasy(event.y)), event)
+
+    def canvas_leave(self, event = None):
+        """ Mouse Cursor has Left the canvas, Remove tooltip """
+        self._hide()
+
+
+
+
+
+
+class AnnotationOverlay(object):
+    """ Class pinning the labels of all visible items of a CanvasToolTip at once, without overlap
+        Usage: overlay = AnnotationOverlay(<tips>, <gap>)
+               overlay.show() / overlay.hide()
+        <tips>      = required, CanvasToolTip whose texts are shown
+        <gap>       = optional, distance in pixels between an item and its label, default 4
+
+        Labels are drawn on the canvas as a rectangle and a text item tagged "tooltip_overlay",
+        they are placed in one pass by place_labels(). Scrolling through xview() / yview() or a
+        resize of the canvas only places the labels of items coming into view, scale() (zoom)
+        places all of them again. Call update() after scrolling the canvas directly. Labels
+        deleted from the canvas directly are placed again by the next update(), the colors
+        follow ToolTipStyle.configure() of the style of <tips>. Callable texts follow the
+        ToolTip of <tips>: computed by its <executor> while its <placeholder> is shown, and
+        TEXT_FAILED is shown if they raise.
+    """
 
+    tag = "tooltip_overlay"                                                     #   Tag of all label items
+
+    def __init__(self, tips, gap = 4):
+        """ AnnotationOverlay initialisation, tips is mandatory """
+        if type(gap) != int or gap < 0:                                         #   Integer expected
+            raise TypeError("<gap> must be a positive integer")
+        self.tips = tips
+        self.canvas = tips.canvas
+        self.gap = gap
+        self.labels = {}                                                        #   item -> (rectangle, text) canvas items
+        self.boxes = {}                                                         #   item -> label (x1, y1, x2, y2)
+        self.shown = False
+        self.pending = None                                                     #   after_idle id of a scheduled update
+        self.futures = {}                                                       #   item -> Future of its text, executor only
+        self.results = {}                                                       #   item -> (callable, text) computed while waiting
+        self.poll = None                                                        #   after id of the check of the futures
+        ToolTipStyle._overlays.add(self)                                        #   Recolored with the style
+
+        self.canvas.bind("<Configure>", self._schedule, add = '+')
+
+    def show(self):
+        """ show the labels of all visible items """
+        self.shown = True
+        self.update(full = True)
+
+    def hide(self):
+        """ remove all labels """
+        self.shown = False
+        self._cancel_texts()
+        self._clear()
+
+    def xview(self, *args):
+        """ scroll the canvas horizontally and place the labels of items coming into view, scrollbar command """
+        self.canvas.xview(*args)
+        self._schedule()
+
+    def yview(self, *args):
+        """ scroll the canvas vertically and place the labels of items coming into view, scrollbar command """
+        self.canvas.yview(*args)
+        self._schedule()
+
+    def scale(self, tagOrId, x, y, xscale, yscale):
+        """ zoom items of the canvas, keep the CanvasToolTip up to date and place all labels again """
+        self._clear()
+        self.canvas.scale(tagOrId, x, y, xscale, yscale)
+        for item in self.canvas.find_withtag(tagOrId):
+            self.tips.refresh(item)
+        self.update(full = True)
+
+    def restyle(self):
+        """ recolor every label from the ToolTip of <tips>, one call per item kind """
+        tip = self.tips.tip
+        self.canvas.itemconfigure(self.tag + "_box", fill = tip.bg, outline = tip.fg)
+        self.canvas.itemconfigure(self.tag + "_text", fill = tip.fg)
+
+    def _schedule(self, event = None):
+        """ update once when Tk is idle, scroll and resize events are coalesced """
+        if self.shown and self.pending == None:
+            self.pending = self.canvas.after_idle(self._scheduled)
+
+    def _scheduled(self):
+        self.pending = None
+        self.update()
+
+    def _region(self):
+        """ return the visible area of the canvas in canvas coordinates """
+        x, y = self.canvas.canvasx(0), self.canvas.canvasy(0)
+        return (x, y, x + self.canvas.winfo_width(), y + self.canvas.winfo_height())
+
+    def _text(self, item):
+        """ return the text of <item>, a callable text is computed once and kept in the TextCache.
+            With an executor its computation is started and the placeholder returned """
+        text = self.tips.texts[item]
+        if type(text) == str:
+            return text
+        if item in self.results and self.results[item][0] is text:              #   Computed while waiting
+            return self.results.pop(item)[1]
+        found, value = _text_cache.get(text)
+        if found:
+            return value
+        tip = self.tips.tip
+        if tip.executor == None:                                                #   Compute on the Tk thread
+            value = _computed(text)
+            _text_cache.put(text, value, tip.ttl)
+            return value
+        if item not in self.futures:
+            self.futures[item] = tip.executor.submit(text)
+            if self.poll == None:
+                self.poll = self.canvas.after(TEXT_POLL, self._poll_texts)
+        return tip.placeholder
+
+    def _poll_texts(self):
+        """ check which texts the executor has computed, their labels replace the placeholders """
+        self.poll = None
+        done = [item for item, future in self.futures.items() if future.done()]
+        for item in done:
+            text = _computed(self.futures.pop(item).result)
+            call = self.tips.texts.get(item)
+            if call != None and type(call) != str:                              #   Item still has a callable text
+                _text_cache.put(call, text, self.tips.tip.ttl)
+                self.results[item] = (call, text)
+                self._remove(item)                                              #   Placed again with its text
+        if len(self.futures) > 0:
+            self.poll = self.canvas.after(TEXT_POLL, self._poll_texts)
+        if len(done) > 0:
+            self._schedule()
+
+    def _cancel_texts(self):
+        """ cancel the computation of the texts, the labels are hidden """
+        for future in self.futures.values():
+            future.cancel()
+        self.futures.clear()
+        self.results.clear()
+        if self.poll != None:
+            self.canvas.after_cancel(self.poll)
+            self.poll = None
+
+    def update(self, full = False):
+        """ place the labels of visible items without one, <full> places all labels again """
+        if not self.shown:
+            return
+        start = _stats and time.perf_counter()
+        bboxes = self.tips.bboxes
+        x1, y1, x2, y2 = region = self._region()
+        alive = set(self.canvas.find_withtag(self.tag + "_box"))                #   Labels not deleted by the application
+        for item, label in list(self.labels.items()):                           #   Keep labels still in view
+            bbox = bboxes.get(item)
+            if (full or label[0] not in alive or bbox == None or
+                    bbox[0] > x2 or bbox[2] < x1 or bbox[1] > y2 or bbox[3] < y1):
+                self._remove(item)
+        items = [item for item, bbox in bboxes.items() if item not in self.labels
+                 and bbox[0] <= x2 and bbox[2] >= x1 and bbox[1] <= y2 and bbox[3] >= y1]
+        items.sort(key = self.tips.order.get, reverse = True)                  #   Topmost items first
+        layouts = [self.tips.tip._tooltip_layout(self._text(item)) for item in items]
+        positions = place_labels([bboxes[item] for item in items], [layout[1:] for layout in layouts],
+                                 list(self.boxes.values()), region, self.gap)
+        for item, layout, position in zip(items, layouts, positions):
+            if position != None:
+                self._draw(item, layout, position)
+        if _stats and start:
+            _stats.time("overlay", time.perf_counter() - start)
+
+    def _draw(self, item, layout, position):
+        """ draw the label of <item> at <position> """
+        tip = self.tips.tip
+        text, width, height = layout
+        x, y = position
+        self.boxes[item] = (x, y, x + width, y + height)
+        self.labels[item] = (
+            self.canvas.create_rectangle(x, y, x + width - 1, y + height - 1, tags = (self.tag, self.tag + "_box"),
+                                         fill = tip.bg, outline = tip.fg, width = LABEL_BORDER),
+            self.canvas.create_text(x + LABEL_PADDING[0], y + LABEL_PADDING[1], tags = (self.tag, self.tag + "_text"),
+                                    text = text, anchor = tk.NW, justify = tk.LEFT, fill = tip.fg,
+                                    font = tip.style.named_font(self.tips.window) if tip._font == None else tip._font))
+
+    def _remove(self, item):
+        """ delete the label of <item> """
+        self.boxes.pop(item, None)
+        for label in self.labels.pop(item, ()):
+            self.canvas.delete(label)
+
+    def _clear(self):
+        """ delete all labels """
+        self.canvas.delete(self.tag)
+        self.labels.clear()
+        self.boxes.clear()
+
+
+
+class ItemToolTip(DelegatedToolTip):
+    """ Class creating row or cell tooltips for a ttk.Treeview or a tk.Listbox with a single binding
+        Usage: ItemToolTip(<widget>, <texts>, <cells>, <options>)
+        <widget>    = required, ttk.Treeview or tk.Listbox
+        <texts>     = required, mapping or callable giving the text of a row, keyed by item id for
+                      a Treeview, by index for a Listbox. With <cells> the key is (item id, column id).
+                      A missing key or None shows no ToolTip
+        <cells>     = optional, one ToolTip per Treeview cell instead of per row, default False
+        <options>   = any other ToolTip keyword, i.e. time, font, fg, bg, style, follow
+
+        The row (and column) under the cursor is resolved on <Motion>, texts are only looked up
+        on hover. Memory does not grow with the number of rows.
+    """
 
+    def __init__(self, widget, texts, cells = False, **options):
+        """ ItemToolTip initialisation, widget and texts are mandatory """
+        if not callable(texts) and not hasattr(texts, "get"):                   #   Mapping or callable expected
+            raise TypeError("<texts> must be a mapping or a callable")
+        self.widget = widget
+        self.texts = texts
+        self.cells = cells
+        self.listbox = isinstance(widget, tk.Listbox)
+        self.position = None                                                    #   (row, raw column, key) of the last cell found
+        DelegatedToolTip.__init__(self, widget, **options)
+
+        self.widget.bind("<Motion>", self.item_motion, add = '+')               #   Single handler for every row
+        self.widget.bind("<Leave>", self.item_leave, add = '+')
+
+    def find(self, x, y):
+        """ return the key of the row (or cell) at widget coordinates <x>, <y>, or None """
+        if self.listbox:
+            index = self.widget.nearest(y)
+            bbox = self.widget.bbox(index)
+            if bbox == None or not bbox[1] <= y < bbox[1] + bbox[3]:            #   Below the last row
+                return None
+            return index
+        row = self.widget.identify_row(y)
+        if row == "":                                                           #   Heading or empty area
+            self.position = None
+            return None
+        if self.cells == False:
+            return row
+        column = self.widget.identify_column(x)
+        if self.position != None and self.position[:2] == (row, column):       #   Same cell, skip the column lookup
+            return self.position[2]
+        key = (row, self.widget.column(column, "id") or column)                 #   "#0" has no id
+        self.position = (row, column, key)
+        return key
+
+    def text(self, key):
+        """ return the text of the row or cell <key>, None for none """
+        text = self.texts(key) if callable(self.texts) else self.texts.get(key)
+        return None if text == None else str(text)
+
+    def item_motion(self, event):
+        """ Mouse Cursor has moved over the widget, show the ToolTip of the row under it """
+        self._hover(self.find(event.x, event.y), event)
+
+    def item_leave(self, event = None):
+        """ Mouse Cursor has Left the widget, Remove tooltip """
+        self._hide()
+        self.position = None
 
 
 
 if __name__ == "__main__":
 
-    if debugging == True: print("Library File Test")
-
     root = tk.Tk()
     root.title("ToolTip Demo")
 
@@ -461,6 +2474,20 @@ if __name__ == "__main__":
 
     Tip2 = ToolTip(Canvas_Text, root, canvas_window1)
 
+    Tips = CanvasToolTip(canvas_window1, root)                                  #   Many items, one <Motion> handler
+    for row in range(10):
+        for column in range(10):
+            Cell = canvas_window1.create_rectangle(100 + 25 * column, 100 + 25 * row,
+                                                   120 + 25 * column, 120 + 25 * row, fill = 'lightblue')
+            Tips.add(Cell, "Cell %d, %d" % (column, row))
+    Overlay = AnnotationOverlay(Tips)                                           #   Show all labels at once on double click
+    canvas_window1.bind("<Double-Button-1>", lambda event: Overlay.hide() if Overlay.shown else Overlay.show())
+
+    Rows = tk.Listbox(root, height = 5)                                         #   Row ToolTips, one <Motion> handler
+    Rows.pack(anchor = tk.N)
+    for row in range(1000):
+        Rows.insert(tk.END, "Row %d" % row)
+    RowTips = ItemToolTip(Rows, lambda index: "Row %d of 1000" % index)
 
 
     Canvas_Frame = tk.Frame(root)
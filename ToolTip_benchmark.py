@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+
+import tkinter as tk
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import ToolTip as tooltip
+
+
+
+####################################################################################################
+###
+###     ToolTip Benchmark
+###
+###     Headless benchmark of the ToolTip library, hovers are driven with event_generate(...)
+###     so no person has to move the mouse. Results are printed as JSON.
+###
+###     Usage:  python ToolTip_benchmark.py [--count N] [--cycles N] [--stats] [--xvfb] [--output FILE]
+###
+###     --xvfb starts a local virtual X server (Xvfb) when no DISPLAY is available.
+###
+###
+
+
+def start_xvfb(display = ":99"):
+    """ start Xvfb on <display> and point DISPLAY at it, return the process """
+    if shutil.which("Xvfb") == None:
+        raise RuntimeError("Xvfb not found, install it or run with a DISPLAY")
+    process = subprocess.Popen(["Xvfb", display, "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+                               stdout = subprocess.DEVNULL, stderr = subprocess.DEVNULL)
+    os.environ["DISPLAY"] = display
+    time.sleep(0.5)                                                             #   Give the server time to accept clients
+    return process
+
+
+def rss_kb():
+    """ return the resident set size of this process in kB, 0 if unknown """
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def shown_window(root):
+    """ return the visible ToolTip window of <root>, or None """
+    tip = tooltip.HoverScheduler.get(root).shown
+    return None if tip == None else tip.tw
+
+
+def percentiles(samples):
+    """ return min / median / p95 / max of <samples> in milliseconds """
+    samples = sorted(samples)
+    if len(samples) == 0:
+        return {}
+    def at(fraction):
+        return samples[min(len(samples) - 1, int(fraction * len(samples)))] * 1000
+    return {"min_ms": samples[0] * 1000, "median_ms": at(0.5), "p95_ms": at(0.95), "max_ms": samples[-1] * 1000,
+            "samples": len(samples)}
+
+
+def bench_registration(root, count):
+    """ ToolTips registered per second, one at a time and with ToolTip.register(...) """
+    frame = tk.Frame(root)
+    labels = [tk.Label(frame, text = str(index)) for index in range(count)]
+
+    start = time.perf_counter()
+    tips = [tooltip.ToolTip(label, text = "Tip %d" % index) for index, label in enumerate(labels)]
+    single = time.perf_counter() - start
+    for tip in tips:
+        tip.remove()
+
+    start = time.perf_counter()
+    tips = tooltip.ToolTip.register([(label, "Tip %d" % index) for index, label in enumerate(labels)])
+    bulk = time.perf_counter() - start
+    for tip in tips:
+        tip.remove()
+
+    start = time.perf_counter()
+    tooltip.ToolTip.register([(label, "Tip %d" % index) for index, label in enumerate(labels)], container = frame)
+    deferred = time.perf_counter() - start
+
+    frame.destroy()
+    return {"count": count,
+            "single_per_s": count / single,
+            "register_per_s": count / bulk,
+            "register_deferred_per_s": count / deferred}
+
+
+def hover(root, enter, leave, repeat):
+    """ return enter-to-mapped latencies of <repeat> hovers, <enter> / <leave> generate the events """
+    samples = []
+    for index in range(repeat):
+        start = time.perf_counter()
+        enter()
+        root.update()
+        window = shown_window(root)
+        if window != None and window.winfo_ismapped():
+            samples.append(time.perf_counter() - start)
+        leave()
+        root.update()
+    return samples
+
+
+def bench_latency(root, repeat):
+    """ enter-to-mapped latency of the widget, canvas and scrolled canvas ToolTips """
+    results = {}
+
+    button = tk.Button(root, text = "Widget")
+    button.pack()
+    tooltip.ToolTip(button, text = "Widget ToolTip")
+    root.update()
+    results["widget"] = percentiles(hover(root,
+                                          lambda: button.event_generate("<Enter>"),
+                                          lambda: button.event_generate("<Leave>"),
+                                          repeat))
+
+    canvas = tk.Canvas(root, width = 200, height = 200)
+    canvas.pack()
+    item = canvas.create_rectangle(10, 10, 60, 60, fill = "grey")
+    tooltip.ToolTip(item, root, canvas, text = "Canvas ToolTip")
+    root.update()
+    results["canvas"] = percentiles(hover(root,
+                                          lambda: canvas.event_generate("<Motion>", x = 30, y = 30),
+                                          lambda: canvas.event_generate("<Motion>", x = 150, y = 150),
+                                          repeat))
+
+    frame = tk.Frame(root)
+    frame.pack()
+    scrolled = tk.Canvas(frame, width = 200, height = 200, scrollregion = (0, 0, 1200, 1200))
+    scrollx = tk.Scrollbar(frame, orient = tk.HORIZONTAL, command = scrolled.xview)
+    scrolly = tk.Scrollbar(frame, orient = tk.VERTICAL, command = scrolled.yview)
+    scrolled.config(xscrollcommand = scrollx.set, yscrollcommand = scrolly.set)
+    scrollx.pack(side = tk.BOTTOM, fill = tk.X)
+    scrolly.pack(side = tk.RIGHT, fill = tk.Y)
+    scrolled.pack()
+    item = scrolled.create_rectangle(10, 10, 60, 60, fill = "grey")
+    tooltip.ToolTip(item, root, scrolled, scrollx, scrolly, 1200, 1200, text = "Scrolled ToolTip")
+    root.update()
+    results["scrolled_canvas"] = percentiles(hover(root,
+                                                   lambda: scrolled.event_generate("<Motion>", x = 30, y = 30),
+                                                   lambda: scrolled.event_generate("<Motion>", x = 150, y = 150),
+                                                   repeat))
+
+    button.destroy()
+    canvas.destroy()
+    frame.destroy()
+    return results
+
+
+def bench_sweep(root, cells, delay):
+    """ sweep the mouse over a grid of <cells> x <cells> labels without pausing """
+    scheduler = tooltip.HoverScheduler.get(root)
+    scheduler.configure(delay = delay)
+    frame = tk.Frame(root)
+    frame.pack()
+    labels = []
+    for row in range(cells):
+        for column in range(cells):
+            label = tk.Label(frame, text = "%d,%d" % (column, row), width = 4)
+            label.grid(row = row, column = column)
+            labels.append(label)
+    tooltip.ToolTip.register([(label, label.cget("text")) for label in labels])
+    root.update()
+
+    shown = 0
+    start = time.perf_counter()
+    for label in labels:
+        label.event_generate("<Enter>")
+        root.update_idletasks()
+        if shown_window(root) != None:
+            shown += 1
+        label.event_generate("<Leave>")
+    root.update()
+    elapsed = time.perf_counter() - start
+
+    scheduler.hide()
+    scheduler.configure(delay = tooltip.HoverScheduler.default_delay)
+    frame.destroy()
+    return {"widgets": len(labels), "delay_ms": delay, "shown": shown,
+            "total_ms": elapsed * 1000, "per_widget_us": elapsed / len(labels) * 1e6}
+
+
+def bench_memory(root, cycles):
+    """ memory growth over <cycles> show / hide cycles """
+    button = tk.Button(root, text = "Memory")
+    button.pack()
+    tooltip.ToolTip(button, text = "Memory ToolTip")
+    root.update()
+
+    for index in range(100):                                                    #   Warm up pools and caches
+        button.event_generate("<Enter>")
+        button.event_generate("<Leave>")
+        root.update_idletasks()
+
+    rss_before = rss_kb()
+    tracemalloc.start()
+    traced_before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    for index in range(cycles):
+        button.event_generate("<Enter>")
+        button.event_generate("<Leave>")
+        root.update_idletasks()
+    elapsed = time.perf_counter() - start
+    traced_after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    rss_after = rss_kb()
+
+    button.destroy()
+    return {"cycles": cycles, "total_s": elapsed,
+            "tracemalloc_growth_bytes": traced_after - traced_before,
+            "rss_growth_kb": rss_after - rss_before}
+
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = "Headless ToolTip benchmark")
+    parser.add_argument("--count", type = int, default = 5000, help = "ToolTips registered")
+    parser.add_argument("--repeat", type = int, default = 200, help = "hovers per latency scenario")
+    parser.add_argument("--sweep", type = int, default = 20, help = "cells per side of the sweep grid")
+    parser.add_argument("--cycles", type = int, default = 100000, help = "show / hide cycles for the memory test")
+    parser.add_argument("--stats", action = "store_true", help = "enable the library stats and report them")
+    parser.add_argument("--xvfb", action = "store_true", help = "start Xvfb if no DISPLAY is set")
+    parser.add_argument("--output", help = "write the JSON results to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    xvfb = None
+    if args.xvfb and not os.environ.get("DISPLAY"):
+        xvfb = start_xvfb()
+    try:
+        if args.stats:
+            tooltip.enable_stats()
+        root = tk.Tk()
+        root.geometry("+0+0")
+        results = {"version": tooltip.VERSION_s,
+                   "python": sys.version.split()[0],
+                   "tk": root.tk.call("info", "patchlevel")}
+        results["registration"] = bench_registration(root, args.count)
+        results["latency"] = bench_latency(root, args.repeat)
+        results["sweep"] = {"no_delay": bench_sweep(root, args.sweep, 0),
+                            "delay_500ms": bench_sweep(root, args.sweep, 500)}
+        results["memory"] = bench_memory(root, args.cycles)
+        if args.stats:
+            results["stats"] = tooltip.ToolTip.stats()
+        root.destroy()
+    finally:
+        if xvfb != None:
+            xvfb.terminate()
+
+    text = json.dumps(results, indent = 2, sort_keys = True)
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()